@@ -4,8 +4,9 @@ File system capability interface.
 This module contains the abstract base class for file system operations.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
 from .models import CommandResult, FileSearchMatch
 
@@ -26,6 +27,14 @@ class FileSystem(ABC):
         """Read the contents of a file."""
         pass
 
+    async def read_file_bytes(self, filename: str, context: "ToolContext") -> bytes:
+        """Read the raw (UTF-8 encoded) contents of a file.
+
+        The default encodes ``read_file``; implementations backed by real
+        files can return the bytes without decoding them first.
+        """
+        return (await self.read_file(filename, context)).encode("utf-8")
+
     @abstractmethod
     async def write_file(
         self,
@@ -37,6 +46,22 @@ class FileSystem(ABC):
         """Write content to a file."""
         pass
 
+    async def write_file_chunks(
+        self,
+        filename: str,
+        chunks: Iterable[str],
+        context: "ToolContext",
+        overwrite: bool = False,
+    ) -> None:
+        """Write content produced in pieces to a file.
+
+        The default joins the chunks in a worker thread, since producing them
+        may be CPU-bound, and calls ``write_file``; implementations backed by
+        real files can stream them instead.
+        """
+        content = await asyncio.to_thread("".join, chunks)
+        await self.write_file(filename, content, context, overwrite=overwrite)
+
     @abstractmethod
     async def exists(self, path: str, context: "ToolContext") -> bool:
         """Check if a file or directory exists."""
@@ -1,12 +1,19 @@
 """Schema catalog capability exports."""
 
 from .base import SchemaCatalog
-from .models import SchemaColumn, SchemaSnapshot, SchemaDiff, SchemaSyncResult
+from .models import (
+    SchemaColumn,
+    SchemaSnapshot,
+    SchemaSnapshotSummary,
+    SchemaDiff,
+    SchemaSyncResult,
+)
 
 __all__ = [
     "SchemaCatalog",
     "SchemaColumn",
     "SchemaSnapshot",
+    "SchemaSnapshotSummary",
     "SchemaDiff",
     "SchemaSyncResult",
 ]
@@ -7,7 +7,7 @@ from typing import Optional
 
 from vanna.core.tool import ToolContext
 
-from .models import SchemaSnapshot, SchemaSyncResult
+from .models import SchemaSnapshot, SchemaSnapshotSummary, SchemaSyncResult
 
 
 class SchemaCatalog(ABC):
@@ -27,3 +27,14 @@ class SchemaCatalog(ABC):
     async def get_latest_snapshot(self) -> Optional[SchemaSnapshot]:
         """Return latest persisted snapshot if available."""
         pass
+
+    async def get_latest_snapshot_summary(self) -> Optional[SchemaSnapshotSummary]:
+        """Return identity fields of the latest snapshot, without its columns.
+
+        Implementations backed by a store should override this to avoid
+        loading the full column list.
+        """
+        latest = await self.get_latest_snapshot()
+        if latest is None:
+            return None
+        return SchemaSnapshotSummary.from_snapshot(latest)
@@ -7,6 +7,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from vanna.core._compat import utcnow
+
 
 class SchemaColumn(BaseModel):
     schema_name: Optional[str] = None
@@ -18,12 +20,30 @@ class SchemaColumn(BaseModel):
 
 class SchemaSnapshot(BaseModel):
     snapshot_id: str
-    captured_at: datetime = Field(default_factory=datetime.utcnow)
+    captured_at: datetime = Field(default_factory=utcnow)
     dialect: str = "unknown"
     schema_hash: str
     columns: List[SchemaColumn] = Field(default_factory=list)
 
 
+class SchemaSnapshotSummary(BaseModel):
+    """Snapshot identity without the column list."""
+
+    snapshot_id: str
+    captured_at: datetime
+    dialect: str = "unknown"
+    schema_hash: str
+
+    @classmethod
+    def from_snapshot(cls, snapshot: SchemaSnapshot) -> SchemaSnapshotSummary:
+        return cls(
+            snapshot_id=snapshot.snapshot_id,
+            captured_at=snapshot.captured_at,
+            dialect=snapshot.dialect,
+            schema_hash=snapshot.schema_hash,
+        )
+
+
 class SchemaDiff(BaseModel):
     previous_schema_hash: Optional[str] = None
     current_schema_hash: str
@@ -1,9 +1,12 @@
 """DataFrame component for displaying tabular data."""
 
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 from pydantic import Field
 from ....core.rich_component import RichComponent, ComponentType
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class DataFrameComponent(RichComponent):
     """DataFrame component specifically for displaying tabular data from SQL queries and similar sources."""
@@ -91,3 +94,32 @@ class DataFrameComponent(RichComponent):
         component_data.update(kwargs)
 
         return cls(**component_data)
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df: "pd.DataFrame",
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "DataFrameComponent":
+        """Create a DataFrame component from a pandas DataFrame.
+
+        The records produced by pandas are stored as ``rows`` directly rather
+        than validated (and copied) row by row. Columns come from the record
+        keys, as in ``from_records``, so duplicate column names collapse the
+        same way in both.
+        """
+        records = cast(List[Dict[str, Any]], df.to_dict("records"))
+        columns = list(records[0]) if records else []
+        component = cls.from_records(
+            records=[],
+            title=title,
+            description=description,
+            columns=columns,
+            row_count=len(records),
+            column_count=len(columns),
+            **kwargs,
+        )
+        component.rows = records
+        return component
@@ -1,16 +1,16 @@
 """Log viewer component."""
 
 import uuid
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
+from ....core._compat import utcnow
 from ....core.rich_component import RichComponent, ComponentType
 
 
 class LogEntry(BaseModel):
     """Log entry for tool execution."""
 
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=lambda: utcnow().isoformat())
     level: str = "info"  # "debug", "info", "warning", "error"
     message: str
     data: Optional[Dict[str, Any]] = None
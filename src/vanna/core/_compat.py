@@ -5,6 +5,8 @@ This module provides compatibility utilities for features that vary across
 Python versions.
 """
 
+from datetime import datetime, timezone
+
 try:
     from enum import StrEnum  # Py 3.11+
 except ImportError:  # Py < 3.11
@@ -16,4 +18,13 @@ except ImportError:  # Py < 3.11
         pass
 
 
-__all__ = ["StrEnum"]
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime.
+
+    Same value as ``datetime.utcnow()``, which is deprecated from Python 3.12
+    and issues a warning on every call there.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+__all__ = ["StrEnum", "utcnow"]
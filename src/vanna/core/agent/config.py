@@ -68,9 +68,7 @@ class UiFeatures(BaseModel):
             return True
 
         # Same intersection logic as tool access control
-        user_groups = set(user.group_memberships)
-        feature_groups = set(allowed_groups)
-        return bool(user_groups & feature_groups)
+        return not set(user.group_memberships).isdisjoint(allowed_groups)
 
     def register_feature(self, name: str, access_groups: List[str]) -> None:
         """Register a custom UI feature with group access control.
@@ -10,7 +10,7 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
-from .._compat import StrEnum
+from .._compat import StrEnum, utcnow
 
 
 class AuditEventType(StrEnum):
@@ -39,7 +39,7 @@ class AuditEvent(BaseModel):
 
     event_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     event_type: AuditEventType
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
 
     # User context
     user_id: str
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
-from jsonschema import validate  # type: ignore[import-untyped]
-from jsonschema.exceptions import ValidationError as JsonSchemaValidationError  # type: ignore[import-untyped]
+from jsonschema.exceptions import best_match  # type: ignore[import-untyped]
+from jsonschema.validators import validator_for  # type: ignore[import-untyped]
 
 
 VEGA_LITE_SPEC_SCHEMA: Dict[str, Any] = {
@@ -43,6 +44,24 @@ PLOTLY_JSON_SPEC_SCHEMA: Dict[str, Any] = {
 }
 
 _DANGEROUS_TOKENS = ("javascript:", "<script", "Function(", "eval(")
+# One case-insensitive scan per string instead of lowering it per token.
+_DANGEROUS_PATTERN = re.compile(
+    "|".join(re.escape(token) for token in _DANGEROUS_TOKENS), re.IGNORECASE
+)
+
+
+def _compile_validator(schema: Dict[str, Any]) -> Any:
+    """Check ``schema`` once and build a reusable validator for it."""
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+# Built once; ``jsonschema.validate`` would re-check the schema on every call.
+_SPEC_VALIDATORS: Dict[str, Any] = {
+    "vega-lite": _compile_validator(VEGA_LITE_SPEC_SCHEMA),
+    "plotly-json": _compile_validator(PLOTLY_JSON_SPEC_SCHEMA),
+}
 
 
 def _assert_safe_payload(value: Any) -> None:
@@ -56,12 +75,8 @@ def _assert_safe_payload(value: Any) -> None:
         for child in value:
             _assert_safe_payload(child)
     elif isinstance(value, str):
-        lowered = value.lower()
-        for token in _DANGEROUS_TOKENS:
-            if token.lower() in lowered:
-                raise ValueError(
-                    "Chart spec contains blocked executable token content."
-                )
+        if _DANGEROUS_PATTERN.search(value):
+            raise ValueError("Chart spec contains blocked executable token content.")
 
 
 class ChartSpec(BaseModel):
@@ -78,18 +93,9 @@ class ChartSpec(BaseModel):
         _assert_safe_payload(self.spec)
         _assert_safe_payload(self.dataset)
 
-        schema = (
-            VEGA_LITE_SPEC_SCHEMA
-            if self.format == "vega-lite"
-            else PLOTLY_JSON_SPEC_SCHEMA
-        )
-
-        try:
-            validate(instance=self.spec, schema=schema)
-        except JsonSchemaValidationError as exc:
-            raise ValueError(
-                f"Invalid {self.format} chart spec: {exc.message}"
-            ) from exc
+        error = best_match(_SPEC_VALIDATORS[self.format].iter_errors(self.spec))
+        if error is not None:
+            raise ValueError(f"Invalid {self.format} chart spec: {error.message}")
 
         return self
 
@@ -3,13 +3,15 @@ Component state management and update protocol for rich components.
 """
 
 import uuid
+from collections import deque
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Deque, Dict, List, Optional, Set, Union
 
 from pydantic import BaseModel, Field
 
 from ..components.rich import ComponentLifecycle, RichComponent
+from ._compat import utcnow
 
 
 class UpdateOperation(str, Enum):
@@ -39,7 +41,7 @@ class ComponentUpdate(BaseModel):
     component: Optional[RichComponent] = None  # New/updated component data
     updates: Optional[Dict[str, Any]] = None  # Partial updates for UPDATE operation
     position: Optional[Position] = None  # For positioning operations
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=lambda: utcnow().isoformat())
     batch_id: Optional[str] = None  # For grouping related updates
 
     def serialize_for_frontend(self) -> Dict[str, Any]:
@@ -130,7 +132,7 @@ class ComponentTree(BaseModel):
         component_data = node.component.model_dump()
         component_data.update(updates)
         component_data["lifecycle"] = ComponentLifecycle.UPDATE
-        component_data["timestamp"] = datetime.utcnow().isoformat()
+        component_data["timestamp"] = utcnow().isoformat()
 
         updated_component = node.component.__class__(**component_data)
         node.component = updated_component
@@ -171,8 +173,18 @@ class ComponentTree(BaseModel):
         if self.root and self.root.component.id == component_id:
             self.root = None
         else:
-            if self.root:
-                self.root.remove_child(component_id)
+            # Go straight to the parent through the index rather than
+            # searching the whole tree; fall back to the search if the
+            # parent link is stale (e.g. the parent was replaced).
+            parent = self.flat_index.get(node.parent_id) if node.parent_id else None
+            siblings = parent.children if parent is not None else []
+            for i, child in enumerate(siblings):
+                if child is node:
+                    del siblings[i]
+                    break
+            else:
+                if self.root:
+                    self.root.remove_child(component_id)
 
         # Remove from flat index (including all children)
         removed_ids = node.get_all_ids()
@@ -209,12 +221,18 @@ class ComponentTree(BaseModel):
 
 
 class ComponentManager:
-    """Manages component lifecycle and state updates."""
+    """Manages component lifecycle and state updates.
+
+    Args:
+        max_history: Keep only the most recent updates in ``update_history``
+            so long-lived managers don't grow without bound. ``None`` keeps
+            every update.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, max_history: Optional[int] = None) -> None:
         self.components: Dict[str, RichComponent] = {}
         self.component_tree = ComponentTree()
-        self.update_history: List[ComponentUpdate] = []
+        self.update_history: Deque[ComponentUpdate] = deque(maxlen=max_history)
         self.active_batch: Optional[str] = None
 
     def emit(self, component: RichComponent) -> Optional[ComponentUpdate]:
@@ -311,7 +329,7 @@ class ComponentManager:
     ) -> List[ComponentUpdate]:
         """Get all updates since a given timestamp."""
         if not timestamp:
-            return self.update_history.copy()
+            return list(self.update_history)
 
         try:
             cutoff = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
@@ -322,7 +340,7 @@ class ComponentManager:
                 > cutoff
             ]
         except ValueError:
-            return self.update_history.copy()
+            return list(self.update_history)
 
     def clear_history(self) -> None:
         """Clear the update history."""
@@ -5,11 +5,12 @@ This module defines the UiComponent class which is the return type for tool exec
 It's placed in core/ because it's a fundamental type that tools return, not just a UI concern.
 """
 
-from datetime import datetime
 from typing import Any, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
+from ._compat import utcnow
+
 
 class UiComponent(BaseModel):
     """Base class for UI components streamed to client.
@@ -21,7 +22,7 @@ class UiComponent(BaseModel):
     Type validation happens at runtime through validators.
     """
 
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=lambda: utcnow().isoformat())
     rich_component: Any = Field(
         ..., description="Rich component for advanced rendering"
     )
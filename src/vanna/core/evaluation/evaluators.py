@@ -50,20 +50,21 @@ class TrajectoryEvaluator(Evaluator):
             )
 
         tools_called = agent_result.get_tool_names_called()
+        called = set(tools_called)  # membership checks below
         issues = []
         score = 1.0
 
         # Check expected tools were called
         if expected.tools_called:
             for expected_tool in expected.tools_called:
-                if expected_tool not in tools_called:
+                if expected_tool not in called:
                     issues.append(f"Expected tool '{expected_tool}' was not called")
                     score -= 0.5 / len(expected.tools_called)
 
         # Check unexpected tools were not called
         if expected.tools_not_called:
             for unexpected_tool in expected.tools_not_called:
-                if unexpected_tool in tools_called:
+                if unexpected_tool in called:
                     issues.append(f"Unexpected tool '{unexpected_tool}' was called")
                     score -= 0.5 / len(expected.tools_not_called)
 
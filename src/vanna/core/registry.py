@@ -105,10 +105,8 @@ class ToolRegistry:
         if not tool_access_groups:
             return True
 
-        user_groups = set(user.group_memberships)
-        tool_groups = set(tool_access_groups)
         # Grant access if any group in user.group_memberships exists in tool.access_groups
-        return bool(user_groups & tool_groups)
+        return not set(user.group_memberships).isdisjoint(tool_access_groups)
 
     async def transform_args(
         self,
@@ -6,12 +6,13 @@ for the component system.
 """
 
 import uuid
-from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, TypeVar
 
 from pydantic import BaseModel, Field
 
+from ._compat import utcnow
+
 # Type variable for self-returning methods
 T = TypeVar("T", bound="RichComponent")
 
@@ -77,7 +78,7 @@ class RichComponent(BaseModel):
     lifecycle: ComponentLifecycle = ComponentLifecycle.CREATE
     data: Dict[str, Any] = Field(default_factory=dict)
     children: List[str] = Field(default_factory=list)  # Child component IDs
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=lambda: utcnow().isoformat())
     visible: bool = True
     interactive: bool = False
 
@@ -86,7 +87,7 @@ class RichComponent(BaseModel):
         updated_data = self.model_dump()
         updated_data.update(kwargs)
         updated_data["lifecycle"] = ComponentLifecycle.UPDATE
-        updated_data["timestamp"] = datetime.utcnow().isoformat()
+        updated_data["timestamp"] = utcnow().isoformat()
         return self.__class__(**updated_data)
 
     def hide(self: T) -> T:
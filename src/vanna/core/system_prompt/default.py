@@ -5,7 +5,8 @@ This module provides a default implementation of the SystemPromptBuilder interfa
 that automatically includes memory workflow instructions when memory tools are available.
 """
 
-from typing import TYPE_CHECKING, List, Optional
+import functools
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from datetime import datetime
 
 from .base import SystemPromptBuilder
@@ -47,111 +48,117 @@ class DefaultSystemPromptBuilder(SystemPromptBuilder):
         if self.base_prompt is not None:
             return self.base_prompt
 
-        # Check which memory tools are available
-        tool_names = [tool.name for tool in tools]
-        has_search = "search_saved_correct_tool_uses" in tool_names
-        has_save = "save_question_tool_args" in tool_names
-        has_text_memory = "save_text_memory" in tool_names
-
-        # Get today's date
-        today_date = datetime.now().strftime("%Y-%m-%d")
-
-        # Base system prompt
-        prompt_parts = [
-            f"You are Vanna, an AI data analyst assistant created to help users with data analysis tasks. Today's date is {today_date}.",
-            "",
-            "Response Guidelines:",
-            "- Any summary of what you did or observations should be the final step.",
-            "- Use the available tools to help the user accomplish their goals.",
-            "- When you execute a query, that raw result is shown to the user outside of your response so YOU DO NOT need to include it in your response. Focus on summarizing and interpreting the results.",
-        ]
-
-        if tools:
-            prompt_parts.append(
-                f"\nYou have access to the following tools: {', '.join(tool_names)}"
-            )
-
-        # Add memory workflow instructions based on available tools
-        if has_search or has_save or has_text_memory:
-            prompt_parts.append("\n" + "=" * 60)
-            prompt_parts.append("MEMORY SYSTEM:")
-            prompt_parts.append("=" * 60)
-
-        if has_search or has_save:
-            prompt_parts.append("\n1. TOOL USAGE MEMORY (Structured Workflow):")
-            prompt_parts.append("-" * 50)
-
-        if has_search:
-            prompt_parts.extend(
-                [
-                    "",
-                    "• BEFORE executing any tool (run_sql, visualize_data, or calculator), you MUST first call search_saved_correct_tool_uses with the user's question to check if there are existing successful patterns for similar questions.",
-                    "",
-                    "• Review the search results (if any) to inform your approach before proceeding with other tool calls.",
-                ]
-            )
-
-        if has_save:
-            prompt_parts.extend(
-                [
-                    "",
-                    "• AFTER successfully executing a tool that produces correct and useful results, you MUST call save_question_tool_args to save the successful pattern for future use.",
-                ]
-            )
-
-        if has_search or has_save:
-            prompt_parts.extend(
-                [
-                    "",
-                    "Example workflow:",
-                    "  • User asks a question",
-                    f'  • First: Call search_saved_correct_tool_uses(question="user\'s question")'
-                    if has_search
-                    else "",
-                    "  • Then: Execute the appropriate tool(s) based on search results and the question",
-                    f'  • Finally: If successful, call save_question_tool_args(question="user\'s question", tool_name="tool_used", args={{the args you used}})'
-                    if has_save
-                    else "",
-                    "",
-                    "Do NOT skip the search step, even if you think you know how to answer. Do NOT forget to save successful executions."
-                    if has_search
-                    else "",
-                    "",
-                    "The only exceptions to searching first are:",
-                    '  • When the user is explicitly asking about the tools themselves (like "list the tools")',
-                    "  • When the user is testing or asking you to demonstrate the save/search functionality itself",
-                ]
-            )
-
-        if has_text_memory:
-            prompt_parts.extend(
-                [
-                    "",
-                    "2. TEXT MEMORY (Domain Knowledge & Context):",
-                    "-" * 50,
-                    "",
-                    "• save_text_memory: Save important context about the database, schema, or domain",
-                    "",
-                    "Use text memory to save:",
-                    "  • Database schema details (column meanings, data types, relationships)",
-                    "  • Company-specific terminology and definitions",
-                    "  • Query patterns or best practices for this database",
-                    "  • Domain knowledge about the business or data",
-                    "  • User preferences for queries or visualizations",
-                    "",
-                    "DO NOT save:",
-                    "  • Information already captured in tool usage memory",
-                    "  • One-time query results or temporary observations",
-                    "",
-                    "Examples:",
-                    '  • save_text_memory(content="The status column uses 1 for active, 0 for inactive")',
-                    '  • save_text_memory(content="MRR means Monthly Recurring Revenue in our schema")',
-                    "  • save_text_memory(content=\"Always exclude test accounts where email contains 'test'\")",
-                ]
-            )
-
-        if has_search or has_save or has_text_memory:
-            # Remove empty strings from the list
-            prompt_parts = [part for part in prompt_parts if part != ""]
-
-        return "\n".join(prompt_parts)
+        # The prompt depends only on the date and the tool names, so turns
+        # with the same tools reuse the rendered text.
+        return _render_default_prompt(
+            datetime.now().strftime("%Y-%m-%d"), tuple(tool.name for tool in tools)
+        )
+
+
+@functools.lru_cache(maxsize=32)
+def _render_default_prompt(today_date: str, tool_names: Tuple[str, ...]) -> str:
+    """Render the default system prompt for a date and set of tool names."""
+    # Check which memory tools are available
+    has_search = "search_saved_correct_tool_uses" in tool_names
+    has_save = "save_question_tool_args" in tool_names
+    has_text_memory = "save_text_memory" in tool_names
+
+    # Base system prompt
+    prompt_parts = [
+        f"You are Vanna, an AI data analyst assistant created to help users with data analysis tasks. Today's date is {today_date}.",
+        "",
+        "Response Guidelines:",
+        "- Any summary of what you did or observations should be the final step.",
+        "- Use the available tools to help the user accomplish their goals.",
+        "- When you execute a query, that raw result is shown to the user outside of your response so YOU DO NOT need to include it in your response. Focus on summarizing and interpreting the results.",
+    ]
+
+    if tool_names:
+        prompt_parts.append(
+            f"\nYou have access to the following tools: {', '.join(tool_names)}"
+        )
+
+    # Add memory workflow instructions based on available tools
+    if has_search or has_save or has_text_memory:
+        prompt_parts.append("\n" + "=" * 60)
+        prompt_parts.append("MEMORY SYSTEM:")
+        prompt_parts.append("=" * 60)
+
+    if has_search or has_save:
+        prompt_parts.append("\n1. TOOL USAGE MEMORY (Structured Workflow):")
+        prompt_parts.append("-" * 50)
+
+    if has_search:
+        prompt_parts.extend(
+            [
+                "",
+                "• BEFORE executing any tool (run_sql, visualize_data, or calculator), you MUST first call search_saved_correct_tool_uses with the user's question to check if there are existing successful patterns for similar questions.",
+                "",
+                "• Review the search results (if any) to inform your approach before proceeding with other tool calls.",
+            ]
+        )
+
+    if has_save:
+        prompt_parts.extend(
+            [
+                "",
+                "• AFTER successfully executing a tool that produces correct and useful results, you MUST call save_question_tool_args to save the successful pattern for future use.",
+            ]
+        )
+
+    if has_search or has_save:
+        prompt_parts.extend(
+            [
+                "",
+                "Example workflow:",
+                "  • User asks a question",
+                f'  • First: Call search_saved_correct_tool_uses(question="user\'s question")'
+                if has_search
+                else "",
+                "  • Then: Execute the appropriate tool(s) based on search results and the question",
+                f'  • Finally: If successful, call save_question_tool_args(question="user\'s question", tool_name="tool_used", args={{the args you used}})'
+                if has_save
+                else "",
+                "",
+                "Do NOT skip the search step, even if you think you know how to answer. Do NOT forget to save successful executions."
+                if has_search
+                else "",
+                "",
+                "The only exceptions to searching first are:",
+                '  • When the user is explicitly asking about the tools themselves (like "list the tools")',
+                "  • When the user is testing or asking you to demonstrate the save/search functionality itself",
+            ]
+        )
+
+    if has_text_memory:
+        prompt_parts.extend(
+            [
+                "",
+                "2. TEXT MEMORY (Domain Knowledge & Context):",
+                "-" * 50,
+                "",
+                "• save_text_memory: Save important context about the database, schema, or domain",
+                "",
+                "Use text memory to save:",
+                "  • Database schema details (column meanings, data types, relationships)",
+                "  • Company-specific terminology and definitions",
+                "  • Query patterns or best practices for this database",
+                "  • Domain knowledge about the business or data",
+                "  • User preferences for queries or visualizations",
+                "",
+                "DO NOT save:",
+                "  • Information already captured in tool usage memory",
+                "  • One-time query results or temporary observations",
+                "",
+                "Examples:",
+                '  • save_text_memory(content="The status column uses 1 for active, 0 for inactive")',
+                '  • save_text_memory(content="MRR means Monthly Recurring Revenue in our schema")',
+                "  • save_text_memory(content=\"Always exclude test accounts where email contains 'test'\")",
+            ]
+        )
+
+    if has_search or has_save or has_text_memory:
+        # Remove empty strings from the list
+        prompt_parts = [part for part in prompt_parts if part != ""]
+
+    return "\n".join(prompt_parts)
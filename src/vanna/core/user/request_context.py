@@ -62,8 +62,16 @@ class RequestContext(BaseModel):
         Returns:
             Header value or default
         """
-        # Case-insensitive header lookup
+        # Fast paths: exact key, then the lowercased form ASGI servers use
+        value = self.headers.get(name)
+        if value is not None:
+            return value
         name_lower = name.lower()
+        value = self.headers.get(name_lower)
+        if value is not None:
+            return value
+
+        # Case-insensitive header lookup
         for key, value in self.headers.items():
             if key.lower() == name_lower:
                 return value
@@ -4,12 +4,23 @@ Integrations module.
 This package contains concrete implementations of core abstractions and capabilities.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .local import MemoryConversationStore
 from .mock import MockLlmService
-from .plotly import PlotlyChartGenerator
 from .sqlite import SqliteRunner
 from .semantic import MockSemanticAdapter
 
+if TYPE_CHECKING:
+    from .plotly import PlotlyChartGenerator
+
+# Exports whose modules pull in heavy dependencies (plotly) are imported on
+# first attribute access, so ``import vanna`` doesn't pay for them.
+_LAZY_EXPORTS = {
+    "PlotlyChartGenerator": ".plotly",
+}
+
 __all__ = [
     "MockLlmService",
     "MemoryConversationStore",
@@ -17,3 +28,12 @@ __all__ = [
     "PlotlyChartGenerator",
     "MockSemanticAdapter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -9,6 +9,7 @@ non-streaming call as ToolCall entries.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
@@ -32,6 +33,11 @@ class AnthropicLlmService(LlmService):
             Defaults to "claude-sonnet-4-5". Can also be set via ANTHROPIC_MODEL env var.
         api_key: API key; falls back to env `ANTHROPIC_API_KEY`.
         base_url: Optional custom base URL; env `ANTHROPIC_BASE_URL` if unset.
+        prompt_caching: Mark the system prompt and the last tool definition as
+            prompt-cache breakpoints so repeated turns reuse them instead of
+            reprocessing them. Off by default, since cache writes are billed
+            differently and some Anthropic-compatible endpoints reject
+            `cache_control`.
         extra_client_kwargs: Extra kwargs forwarded to `anthropic.Anthropic()`.
     """
 
@@ -40,6 +46,7 @@ class AnthropicLlmService(LlmService):
         model: Optional[str] = None,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
+        prompt_caching: bool = False,
         **extra_client_kwargs: Any,
     ) -> None:
         try:
@@ -60,13 +67,16 @@ class AnthropicLlmService(LlmService):
         if base_url:
             client_kwargs["base_url"] = base_url
 
+        self.prompt_caching = prompt_caching
         self._client = anthropic.Anthropic(**client_kwargs)
 
     async def send_request(self, request: LlmRequest) -> LlmResponse:
         """Send a non-streaming request to Anthropic and return the response."""
         payload = self._build_payload(request)
 
-        resp = self._client.messages.create(**payload)
+        # The client is synchronous; run the call on a worker thread so the
+        # event loop keeps serving other requests while it waits.
+        resp = await asyncio.to_thread(self._client.messages.create, **payload)
 
         logger.info(f"Anthropic response: {resp}")
 
@@ -205,6 +215,11 @@ class AnthropicLlmService(LlmService):
                 }
                 for t in request.tools
             ]
+            if self.prompt_caching:
+                # Tool definitions precede the system prompt in the cached
+                # prefix and change less often; give them their own
+                # breakpoint so they stay cached when the system prompt varies.
+                tools_payload[-1]["cache_control"] = {"type": "ephemeral"}
 
         payload: Dict[str, Any] = {
             "model": self.model,
@@ -219,7 +234,18 @@ class AnthropicLlmService(LlmService):
 
         # Add system prompt if provided
         if request.system_prompt:
-            payload["system"] = request.system_prompt
+            if self.prompt_caching:
+                # The system prompt is stable across the turns of a
+                # conversation; cache the prefix up to and including it.
+                payload["system"] = [
+                    {
+                        "type": "text",
+                        "text": request.system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
+            else:
+                payload["system"] = request.system_prompt
 
         return payload
 
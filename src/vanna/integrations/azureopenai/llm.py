@@ -8,10 +8,13 @@ authentication flows.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 from typing import Any, AsyncGenerator, Dict, List, Optional, Set
 
+from pydantic_core import from_json
+
 from vanna.core.llm import (
     LlmService,
     LlmRequest,
@@ -121,8 +124,11 @@ class AzureOpenAILlmService(LlmService):
         """Send a non-streaming request to Azure OpenAI and return the response."""
         payload = self._build_payload(request)
 
-        # Call the API synchronously; this function is async but we can block here.
-        resp = self._client.chat.completions.create(**payload, stream=False)
+        # The client is synchronous; run the call on a worker thread so the
+        # event loop keeps serving other requests while it waits.
+        resp = await asyncio.to_thread(
+            self._client.chat.completions.create, **payload, stream=False
+        )
 
         if not resp.choices:
             return LlmResponse(content=None, tool_calls=None, finish_reason=None)
@@ -164,7 +170,8 @@ class AzureOpenAILlmService(LlmService):
         stream = self._client.chat.completions.create(**payload, stream=True)
 
         # Builders for streamed tool-calls (index -> partial)
-        tc_builders: Dict[int, Dict[str, Optional[str]]] = {}
+        # Argument fragments are collected in a list and joined once at the end.
+        tc_builders: Dict[int, Dict[str, Any]] = {}
         last_finish: Optional[str] = None
 
         for event in stream:
@@ -189,7 +196,7 @@ class AzureOpenAILlmService(LlmService):
                 for tc in streamed_tool_calls:
                     idx = getattr(tc, "index", 0) or 0
                     b = tc_builders.setdefault(
-                        idx, {"id": None, "name": None, "arguments": ""}
+                        idx, {"id": None, "name": None, "arguments": []}
                     )
                     if getattr(tc, "id", None):
                         b["id"] = tc.id
@@ -198,7 +205,7 @@ class AzureOpenAILlmService(LlmService):
                         if getattr(fn, "name", None):
                             b["name"] = fn.name
                         if getattr(fn, "arguments", None):
-                            b["arguments"] = (b["arguments"] or "") + fn.arguments
+                            b["arguments"].append(fn.arguments)
 
             last_finish = getattr(choice, "finish_reason", last_finish)
 
@@ -207,9 +214,9 @@ class AzureOpenAILlmService(LlmService):
         for b in tc_builders.values():
             if not b.get("name"):
                 continue
-            args_raw = b.get("arguments") or "{}"
+            args_raw = "".join(b["arguments"]) or "{}"
             try:
-                loaded = json.loads(args_raw)
+                loaded = from_json(args_raw)
                 if isinstance(loaded, dict):
                     args_dict: Dict[str, Any] = loaded
                 else:
@@ -312,7 +319,7 @@ class AzureOpenAILlmService(LlmService):
                 continue
             args_raw = getattr(fn, "arguments", "{}")
             try:
-                loaded = json.loads(args_raw)
+                loaded = from_json(args_raw)
                 if isinstance(loaded, dict):
                     args_dict: Dict[str, Any] = loaded
                 else:
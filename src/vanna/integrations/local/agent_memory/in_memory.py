@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import asyncio
 import difflib
+import heapq
 import time
 import uuid
 from datetime import datetime
@@ -69,10 +70,19 @@ class DemoAgentMemory(AgentMemory):
 
         Returns the maximum of Jaccard similarity and difflib ratio.
         """
-        a_norm, b_norm = cls._normalize(a), cls._normalize(b)
+        a_norm = cls._normalize(a)
+        return cls._similarity_normalized(a_norm, cls._tokenize(a_norm), b)
+
+    @classmethod
+    def _similarity_normalized(cls, a_norm: str, ta: set[str], b: str) -> float:
+        """``_similarity`` with ``a`` already normalized and tokenized.
+
+        Searches prepare the query once and compare it to every candidate.
+        """
+        b_norm = cls._normalize(b)
 
         # Jaccard over whitespace tokens
-        ta, tb = cls._tokenize(a_norm), cls._tokenize(b_norm)
+        tb = cls._tokenize(b_norm)
         if not ta and not tb:
             jaccard = 1.0
         elif not ta or not tb:
@@ -135,38 +145,40 @@ class DemoAgentMemory(AgentMemory):
     ) -> List[ToolMemorySearchResult]:
         """Search for similar tool usage patterns based on a question."""
         q = self._normalize(question)
+        q_tokens = self._tokenize(q)
 
         async with self._lock:
-            # Filter candidates by tool name and success status
-            candidates = [
-                m
-                for m in self._memories
-                if m.success
-                and (tool_name_filter is None or m.tool_name == tool_name_filter)
-            ]
-
-            # Score each candidate by question similarity, then weight by feedback.
+            # Score each successful candidate by question similarity, then
+            # weight by feedback. Filtering on raw similarity happens here so
+            # only matches are kept for ranking.
             results: List[tuple[ToolMemory, float, float]] = []
-            for m in candidates:
-                similarity = min(self._similarity(q, m.question), 1.0)
+            for m in self._memories:
+                if not m.success or (
+                    tool_name_filter is not None and m.tool_name != tool_name_filter
+                ):
+                    continue
+                similarity = min(
+                    self._similarity_normalized(q, q_tokens, m.question), 1.0
+                )
+                if similarity < similarity_threshold:
+                    continue
                 weight = 1.0
                 if m.metadata and isinstance(m.metadata.get("weight"), (int, float)):
                     weight = float(m.metadata["weight"])
                 effective = similarity * weight
                 results.append((m, similarity, effective))
 
-            # Filter on raw similarity, rank by effective (similarity * weight).
-            results = [r for r in results if r[1] >= similarity_threshold]
-            results.sort(key=lambda x: x[2], reverse=True)
+            # Rank by effective (similarity * weight), keeping only the top
+            # ``limit`` instead of sorting every match.
+            top = heapq.nlargest(limit, results, key=lambda x: x[2])
 
-            out: List[ToolMemorySearchResult] = []
-            for idx, (m, similarity, _effective) in enumerate(results[:limit], start=1):
-                out.append(
-                    ToolMemorySearchResult(
-                        memory=m, similarity_score=similarity, rank=idx
-                    )
+            # Memories and scores are already validated; skip re-validation.
+            return [
+                ToolMemorySearchResult.model_construct(
+                    memory=m, similarity_score=similarity, rank=idx
                 )
-            return out
+                for idx, (m, similarity, _effective) in enumerate(top, start=1)
+            ]
 
     async def search_text_memories(
         self,
@@ -178,28 +190,28 @@ class DemoAgentMemory(AgentMemory):
     ) -> List[TextMemorySearchResult]:
         """Search free-form text memories using the demo similarity metric."""
         normalized_query = self._normalize(query)
+        query_tokens = self._tokenize(normalized_query)
 
         async with self._lock:
             scored: List[tuple[TextMemory, float]] = []
             for memory in self._text_memories:
-                score = self._similarity(normalized_query, memory.content)
-                scored.append((memory, min(score, 1.0)))
+                score = min(
+                    self._similarity_normalized(
+                        normalized_query, query_tokens, memory.content
+                    ),
+                    1.0,
+                )
+                if score >= similarity_threshold:
+                    scored.append((memory, score))
 
-            scored = [
-                (memory, score)
-                for memory, score in scored
-                if score >= similarity_threshold
-            ]
-            scored.sort(key=lambda item: item[1], reverse=True)
-
-            results: List[TextMemorySearchResult] = []
-            for idx, (memory, score) in enumerate(scored[:limit], start=1):
-                results.append(
-                    TextMemorySearchResult(
-                        memory=memory, similarity_score=score, rank=idx
-                    )
+            top = heapq.nlargest(limit, scored, key=lambda item: item[1])
+
+            return [
+                TextMemorySearchResult.model_construct(
+                    memory=memory, similarity_score=score, rank=idx
                 )
-            return results
+                for idx, (memory, score) in enumerate(top, start=1)
+            ]
 
     async def get_recent_memories(
         self, context: ToolContext, limit: int = 10
@@ -7,7 +7,7 @@ This module provides a local file system implementation with per-user isolation.
 import asyncio
 import hashlib
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from vanna.capabilities.file_system import CommandResult, FileSearchMatch, FileSystem
 from vanna.core.tool import ToolContext
@@ -29,6 +29,9 @@ class LocalFileSystem(FileSystem):
                 current working directory.
         """
         self.working_directory = Path(working_directory)
+        # Created user directories by user ID, so repeat calls skip the hash
+        # and the mkdir syscall.
+        self._user_dirs: Dict[str, Path] = {}
 
     def _get_user_directory(self, context: ToolContext) -> Path:
         """Get the user-specific directory by hashing the user ID.
@@ -39,6 +42,10 @@ class LocalFileSystem(FileSystem):
         Returns:
             Path to the user-specific directory
         """
+        user_dir = self._user_dirs.get(context.user.id)
+        if user_dir is not None:
+            return user_dir
+
         # Hash the user ID to create a directory name
         user_hash = hashlib.sha256(context.user.id.encode()).hexdigest()[:16]
         user_dir = self.working_directory / user_hash
@@ -46,6 +53,7 @@ class LocalFileSystem(FileSystem):
         # Create the directory if it doesn't exist
         user_dir.mkdir(parents=True, exist_ok=True)
 
+        self._user_dirs[context.user.id] = user_dir
         return user_dir
 
     def _resolve_path(self, path: str, context: ToolContext) -> Path:
@@ -100,6 +108,18 @@ class LocalFileSystem(FileSystem):
 
         return file_path.read_text(encoding="utf-8")
 
+    async def read_file_bytes(self, filename: str, context: ToolContext) -> bytes:
+        """Read the raw contents of a file within the user's isolated space."""
+        file_path = self._resolve_path(filename, context)
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"File '{filename}' does not exist")
+
+        if not file_path.is_file():
+            raise IsADirectoryError(f"'{filename}' is a directory, not a file")
+
+        return file_path.read_bytes()
+
     async def write_file(
         self, filename: str, content: str, context: ToolContext, overwrite: bool = False
     ) -> None:
@@ -116,6 +136,35 @@ class LocalFileSystem(FileSystem):
 
         file_path.write_text(content, encoding="utf-8")
 
+    async def write_file_chunks(
+        self,
+        filename: str,
+        chunks: Iterable[str],
+        context: ToolContext,
+        overwrite: bool = False,
+    ) -> None:
+        """Stream chunks to a file within the user's isolated space.
+
+        Producing and writing the chunks both happen in a worker thread, so
+        neither blocks the event loop.
+        """
+        file_path = self._resolve_path(filename, context)
+
+        def write() -> None:
+            # Create parent directories if they don't exist
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+
+            if file_path.exists() and not overwrite:
+                raise FileExistsError(
+                    f"File '{filename}' already exists. "
+                    "Use overwrite=True to replace it."
+                )
+
+            with open(file_path, "w", encoding="utf-8") as fh:
+                fh.writelines(chunks)
+
+        await asyncio.to_thread(write)
+
     async def exists(self, path: str, context: ToolContext) -> bool:
         """Check if a file or directory exists within the user's isolated space."""
         try:
@@ -186,19 +235,18 @@ class LocalFileSystem(FileSystem):
                     continue
 
             if include_content and content is not None:
-                if query_lower in content.lower():
+                # Lowercase the content once and locate the match directly.
+                index = content.lower().find(query_lower)
+                if index != -1:
                     # Create snippet
-                    lowered = content.lower()
-                    index = lowered.find(query_lower)
-                    if index != -1:
-                        context_window = 60
-                        start = max(0, index - context_window)
-                        end = min(len(content), index + len(query) + context_window)
-                        snippet = content[start:end].replace("\n", " ").strip()
-                        if start > 0:
-                            snippet = f"…{snippet}"
-                        if end < len(content):
-                            snippet = f"{snippet}…"
+                    context_window = 60
+                    start = max(0, index - context_window)
+                    end = min(len(content), index + len(query) + context_window)
+                    snippet = content[start:end].replace("\n", " ").strip()
+                    if start > 0:
+                        snippet = f"…{snippet}"
+                    if end < len(content):
+                        snippet = f"{snippet}…"
                     include_entry = True
                 elif not include_entry:
                     continue
@@ -86,6 +86,15 @@ class FileSystemConversationStore(ConversationStore):
 
         return messages
 
+    def _count_messages(self, conversation_id: str) -> int:
+        """Count the stored message files for a conversation."""
+        messages_dir = self._get_messages_dir(conversation_id)
+
+        if not messages_dir.exists():
+            return 0
+
+        return sum(1 for _ in messages_dir.glob("*.json"))
+
     def _append_message(
         self, conversation_id: str, message: Message, index: int
     ) -> None:
@@ -162,9 +171,9 @@ class FileSystemConversationStore(ConversationStore):
         # Save updated metadata
         self._save_metadata(conversation)
 
-        # Get existing messages count to determine new message indices
-        existing_messages = self._load_messages(conversation.id)
-        existing_count = len(existing_messages)
+        # Count stored message files to determine new message indices; no
+        # need to read and validate messages that are already on disk.
+        existing_count = self._count_messages(conversation.id)
 
         # Only append new messages (ones not already saved)
         for i, message in enumerate(
@@ -212,6 +221,11 @@ class FileSystemConversationStore(ConversationStore):
         if not self.base_dir.exists():
             return []
 
+        # Build each conversation from its metadata while ranking, so a
+        # broken entry is skipped before pagination exactly as it was when
+        # every conversation was loaded in full. Messages, which can't make
+        # a conversation fail (bad message files are skipped), are then read
+        # for the requested page alone.
         conversations = []
 
         # Iterate through all conversation directories
@@ -232,24 +246,24 @@ class FileSystemConversationStore(ConversationStore):
                 if metadata["user"]["id"] != user.id:
                     continue
 
-                # Load messages
-                messages = self._load_messages(conv_dir.name)
-
-                # Reconstruct conversation
                 conversation = Conversation(
                     id=metadata["id"],
                     user=User.model_validate(metadata["user"]),
-                    messages=messages,
                     created_at=datetime.fromisoformat(metadata["created_at"]),
                     updated_at=datetime.fromisoformat(metadata["updated_at"]),
                 )
-                conversations.append(conversation)
+                conversations.append((conversation, conv_dir))
             except (json.JSONDecodeError, ValueError, KeyError) as e:
                 print(f"Failed to load conversation from {conv_dir}: {e}")
                 continue
 
         # Sort by updated_at desc
-        conversations.sort(key=lambda x: x.updated_at, reverse=True)
+        conversations.sort(key=lambda x: x[0].updated_at, reverse=True)
 
         # Apply pagination
-        return conversations[offset : offset + limit]
+        page = []
+        for conversation, conv_dir in conversations[offset : offset + limit]:
+            conversation.messages = self._load_messages(conv_dir.name)
+            page.append(conversation)
+
+        return page
@@ -16,6 +16,15 @@ class MemoryConversationStore(ConversationStore):
 
     def __init__(self) -> None:
         self._conversations: Dict[str, Conversation] = {}
+        # user id -> conversation ids (a dict used as an insertion-ordered set)
+        # so listing a user's conversations doesn't scan everyone's.
+        self._ids_by_user: Dict[str, Dict[str, None]] = {}
+
+    def _index(self, conversation: Conversation) -> None:
+        previous = self._conversations.get(conversation.id)
+        if previous is not None and previous.user.id != conversation.user.id:
+            self._ids_by_user.get(previous.user.id, {}).pop(conversation.id, None)
+        self._ids_by_user.setdefault(conversation.user.id, {})[conversation.id] = None
 
     async def create_conversation(
         self, conversation_id: str, user: User, initial_message: str
@@ -26,6 +35,7 @@ class MemoryConversationStore(ConversationStore):
             user=user,
             messages=[Message(role="user", content=initial_message)],
         )
+        self._index(conversation)
         self._conversations[conversation_id] = conversation
         return conversation
 
@@ -40,6 +50,7 @@ class MemoryConversationStore(ConversationStore):
 
     async def update_conversation(self, conversation: Conversation) -> None:
         """Update conversation with new messages."""
+        self._index(conversation)
         self._conversations[conversation.id] = conversation
 
     async def delete_conversation(self, conversation_id: str, user: User) -> bool:
@@ -47,6 +58,7 @@ class MemoryConversationStore(ConversationStore):
         conversation = await self.get_conversation(conversation_id, user)
         if conversation:
             del self._conversations[conversation_id]
+            self._ids_by_user[user.id].pop(conversation_id, None)
             return True
         return False
 
@@ -55,7 +67,8 @@ class MemoryConversationStore(ConversationStore):
     ) -> List[Conversation]:
         """List conversations for user."""
         user_conversations = [
-            conv for conv in self._conversations.values() if conv.user.id == user.id
+            self._conversations[conversation_id]
+            for conversation_id in self._ids_by_user.get(user.id, {})
         ]
         # Sort by updated_at desc
         user_conversations.sort(key=lambda x: x.updated_at, reverse=True)
@@ -8,7 +8,9 @@ name/synonym; ``execute`` runs the metric's SQL through an injected
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, cast
+import functools
+import re
+from typing import Any, Dict, List, Optional, Pattern, Tuple, cast
 
 import yaml
 
@@ -22,11 +24,40 @@ from vanna.capabilities.sql_runner import RunSqlToolArgs, SqlRunner
 from vanna.core.tool import ToolContext
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_terms(terms: Tuple[str, ...]) -> Pattern[str]:
+    """Compile literal terms into one alternation, shared across adapters."""
+    return re.compile("|".join(map(re.escape, terms)))
+
+
+@functools.lru_cache(maxsize=256)
+def _first_match(
+    patterns: Tuple[Pattern[str], ...], any_pattern: Pattern[str], lowered: str
+) -> Optional[int]:
+    """Index of the first pattern found in ``lowered``, or None.
+
+    ``any_pattern`` combines all of ``patterns`` so a miss costs one scan.
+    Patterns come from ``_compile_terms``, so the cache is shared by adapters
+    with the same metrics and a re-asked question reuses the earlier result.
+    """
+    if not any_pattern.search(lowered):
+        return None
+    # Declaration order decides between metrics, not match position.
+    for index, pattern in enumerate(patterns):
+        if pattern.search(lowered):
+            return index
+    return None
+
+
 class _Metric:
     def __init__(self, name: str, sql: str, synonyms: List[str]):
         self.name = name
         self.sql = sql
         self.synonyms = synonyms
+        # Lowercased name and synonyms, built once at load time for matching.
+        self.terms: Tuple[str, ...] = (name.lower(), *synonyms)
+        # All terms as one literal alternation: a single scan per message.
+        self.pattern: Pattern[str] = _compile_terms(self.terms)
 
 
 class FileSemanticAdapter(SemanticAdapter):
@@ -36,6 +67,15 @@ class FileSemanticAdapter(SemanticAdapter):
         self.model_path = model_path
         self.sql_runner = sql_runner
         self._metrics: Dict[str, _Metric] = self._load_model(model_path)
+        # Every metric's terms in one alternation, so a message that matches
+        # no metric is rejected with a single scan.
+        self._any_metric: Pattern[str] = _compile_terms(
+            tuple(term for metric in self._metrics.values() for term in metric.terms)
+        )
+        self._metric_list: Tuple[_Metric, ...] = tuple(self._metrics.values())
+        self._patterns: Tuple[Pattern[str], ...] = tuple(
+            metric.pattern for metric in self._metric_list
+        )
 
     @staticmethod
     def _load_model(path: str) -> Dict[str, "_Metric"]:
@@ -52,12 +92,10 @@ class FileSemanticAdapter(SemanticAdapter):
         return metrics
 
     def _match(self, message: str) -> Optional[_Metric]:
-        lowered = message.lower()
-        for metric in self._metrics.values():
-            terms = [metric.name.lower(), *metric.synonyms]
-            if any(term in lowered for term in terms):
-                return metric
-        return None
+        if not self._metrics:
+            return None
+        index = _first_match(self._patterns, self._any_metric, message.lower())
+        return None if index is None else self._metric_list[index]
 
     async def plan(self, message: str, context: ToolContext) -> SemanticPlanHint:
         metric = self._match(message)
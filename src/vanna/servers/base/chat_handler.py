@@ -2,6 +2,7 @@
 Framework-agnostic chat handling logic.
 """
 
+import secrets
 import uuid
 from typing import AsyncGenerator, List
 
@@ -62,4 +63,4 @@ class ChatHandler:
 
     def _generate_conversation_id(self) -> str:
         """Generate new conversation ID."""
-        return f"conv_{uuid.uuid4().hex[:8]}"
+        return "conv_" + secrets.token_hex(4)
@@ -1,9 +1,10 @@
 """Versioned v3 streaming event models."""
 
 import time
-from typing import Any, Dict, Literal
+from typing import Any, Dict, Iterable, Literal
 
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
 
 from .models import ChatStreamChunk
 
@@ -17,6 +18,33 @@ EventType = Literal[
     "done",
 ]
 
+_EVENT_TYPE_BY_RICH_TYPE: Dict[str, EventType] = {
+    "status_bar_update": "status",
+    "text": "assistant_text",
+    "dataframe": "table_result",
+    "chart": "chart_spec",
+}
+
+
+# Constant parts of the serialized done event; see ChatEvent.done_json.
+_DONE_JSON_PREFIX = b'{"event_version":"v3","event_type":"done","conversation_id":'
+_DONE_JSON_SUFFIX = b',"payload":{"status":"done"}}'
+_POLL_JSON_PREFIX = b'{"event_version":"v3","events":['
+_POLL_JSON_SUFFIX = b"]}"
+
+
+def event_type_for_chunk(chunk: ChatStreamChunk) -> EventType:
+    """Map a chunk's rich component type to its v3 event type."""
+    rich_type = (chunk.rich or {}).get("type")
+    if not isinstance(rich_type, str):
+        return "component"
+    return _EVENT_TYPE_BY_RICH_TYPE.get(rich_type, "component")
+
+
+def poll_response_json(events: Iterable[bytes]) -> bytes:
+    """Wrap already-serialized events in the v3 poll response envelope."""
+    return _POLL_JSON_PREFIX + b",".join(events) + _POLL_JSON_SUFFIX
+
 
 class ChatEvent(BaseModel):
     """Typed streaming event for v3 clients."""
@@ -31,21 +59,8 @@ class ChatEvent(BaseModel):
     @classmethod
     def from_chunk(cls, chunk: ChatStreamChunk) -> "ChatEvent":
         """Convert a v2-compatible chunk into a typed v3 event."""
-        rich = chunk.rich or {}
-        rich_type = rich.get("type")
-
-        event_type: EventType = "component"
-        if rich_type == "status_bar_update":
-            event_type = "status"
-        elif rich_type == "text":
-            event_type = "assistant_text"
-        elif rich_type == "dataframe":
-            event_type = "table_result"
-        elif rich_type == "chart":
-            event_type = "chart_spec"
-
         return cls(
-            event_type=event_type,
+            event_type=event_type_for_chunk(chunk),
             conversation_id=chunk.conversation_id,
             request_id=chunk.request_id,
             timestamp=chunk.timestamp,
@@ -55,6 +70,24 @@ class ChatEvent(BaseModel):
             },
         )
 
+    @staticmethod
+    def json_from_chunk(chunk: ChatStreamChunk) -> bytes:
+        """Serialize a chunk straight to v3 event JSON.
+
+        Produces the same bytes as ``from_chunk(chunk).model_dump_json()``
+        without constructing and validating an intermediate ``ChatEvent``.
+        """
+        return to_json(
+            {
+                "event_version": "v3",
+                "event_type": event_type_for_chunk(chunk),
+                "conversation_id": chunk.conversation_id,
+                "request_id": chunk.request_id,
+                "timestamp": chunk.timestamp,
+                "payload": {"rich": chunk.rich, "simple": chunk.simple},
+            }
+        )
+
     @classmethod
     def done(cls, conversation_id: str, request_id: str) -> "ChatEvent":
         """Completion event."""
@@ -64,3 +97,22 @@ class ChatEvent(BaseModel):
             request_id=request_id,
             payload={"status": "done"},
         )
+
+    @staticmethod
+    def done_json(conversation_id: str, request_id: str) -> bytes:
+        """Serialize a completion event from a precomputed template.
+
+        Equivalent to ``done(...).model_dump_json()``; only the IDs and the
+        timestamp are encoded per call.
+        """
+        return b"".join(
+            (
+                _DONE_JSON_PREFIX,
+                to_json(conversation_id),
+                b',"request_id":',
+                to_json(request_id),
+                b',"timestamp":',
+                to_json(time.time()),
+                _DONE_JSON_SUFFIX,
+            )
+        )
@@ -0,0 +1,78 @@
+"""Cached schema snapshot metadata attached to chat requests."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from ...capabilities.schema_catalog import SchemaCatalog
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaMetadataCache:
+    """Stale-while-revalidate cache of the latest schema snapshot identity.
+
+    The first call loads the metadata; afterwards, calls return the cached
+    value immediately and, once it is older than ``ttl_s``, schedule a single
+    background refresh on the running loop. ``invalidate`` forces the next
+    call to reload (e.g. after an on-demand schema sync).
+    """
+
+    def __init__(self, service: Optional[SchemaCatalog], ttl_s: float = 5.0):
+        self._service = service
+        self._ttl_s = ttl_s
+        self._value: Optional[Dict[str, Any]] = None
+        self._fetched_at = 0.0
+        self._generation = 0
+        self._refresh: Optional["asyncio.Task[None]"] = None
+
+    def fresh_value(self) -> Optional[Dict[str, Any]]:
+        """Return the cached metadata if present and within the TTL."""
+        value = self._value
+        if value is not None and time.monotonic() - self._fetched_at < self._ttl_s:
+            return value
+        return None
+
+    async def get(self) -> Dict[str, Any]:
+        """Return schema metadata, refreshing in the background when stale."""
+        if self._service is None:
+            return {}
+        value = self._value
+        if value is None:
+            await self._load()
+            return self._value or {}
+        if time.monotonic() - self._fetched_at >= self._ttl_s and (
+            self._refresh is None or self._refresh.done()
+        ):
+            # Held on self so the task can't be collected while it runs.
+            self._refresh = asyncio.ensure_future(self._refresh_in_background())
+        return value
+
+    def invalidate(self) -> None:
+        """Drop the cached value so the next call reloads it."""
+        self._generation += 1
+        self._value = None
+
+    async def _refresh_in_background(self) -> None:
+        """Reload the metadata, logging failures; the stale value is kept."""
+        try:
+            await self._load()
+        except Exception:
+            logger.exception("Failed to refresh schema metadata")
+
+    async def _load(self) -> None:
+        assert self._service is not None
+        generation = self._generation
+        latest = await self._service.get_latest_snapshot_summary()
+        if generation != self._generation:
+            # Invalidated while loading; the result may predate a sync.
+            return
+        if latest is None:
+            self._value = {}
+        else:
+            self._value = {
+                "schema_hash": latest.schema_hash,
+                "schema_snapshot_id": latest.snapshot_id,
+            }
+        self._fetched_at = time.monotonic()
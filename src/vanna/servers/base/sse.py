@@ -0,0 +1,92 @@
+"""Server-Sent Events framing and chat streams shared by the server integrations.
+
+The streams are plain async generators of encoded SSE frames, so each
+server only has to hand them to its own streaming response: FastAPI
+iterates them natively, and Flask drives them through its background-loop
+bridge.
+"""
+
+import json
+import logging
+from typing import AsyncGenerator, Dict, Optional
+
+from .chat_handler import ChatHandler
+from .events_v3 import ChatEvent, event_type_for_chunk
+from .models import ChatRequest
+
+logger = logging.getLogger(__name__)
+
+
+# Encoded "event: <type>\ndata: " prefixes, filled in as event types are seen.
+_EVENT_PREFIXES: Dict[str, bytes] = {}
+_DONE_FRAME = b"data: [DONE]\n\n"
+
+
+def sse_frame(data: bytes, event_type: Optional[str] = None) -> bytes:
+    """Build one SSE frame from an already-encoded ``data`` payload."""
+    if event_type is None:
+        return b"data: " + data + b"\n\n"
+    prefix = _EVENT_PREFIXES.get(event_type)
+    if prefix is None:
+        prefix = _EVENT_PREFIXES[event_type] = (
+            b"event: " + event_type.encode() + b"\ndata: "
+        )
+    return prefix + data + b"\n\n"
+
+
+async def chat_sse_stream(
+    chat_handler: ChatHandler, chat_request: ChatRequest
+) -> AsyncGenerator[bytes, None]:
+    """Stream v2 chat chunks as SSE frames, ending with ``[DONE]``.
+
+    A failure mid-stream is reported to the client as a final error frame.
+    """
+    try:
+        async for chunk in chat_handler.handle_stream(chat_request):
+            yield sse_frame(chunk.__pydantic_serializer__.to_json(chunk))
+        yield _DONE_FRAME
+    except ConnectionResetError:
+        raise
+    except Exception as e:
+        logger.exception("SSE chat stream failed")
+        error_data = {
+            "type": "error",
+            "data": {"message": str(e)},
+            "conversation_id": chat_request.conversation_id or "",
+            "request_id": chat_request.request_id or "",
+        }
+        yield sse_frame(json.dumps(error_data).encode())
+
+
+async def chat_events_v3_stream(
+    chat_handler: ChatHandler, chat_request: ChatRequest
+) -> AsyncGenerator[bytes, None]:
+    """Stream typed v3 events as SSE frames, ending with a ``done`` event.
+
+    A failure mid-stream is reported to the client as a final ``error`` event.
+    """
+    last_conversation_id = chat_request.conversation_id or ""
+    last_request_id = chat_request.request_id or ""
+    try:
+        async for chunk in chat_handler.handle_stream(chat_request):
+            last_conversation_id = chunk.conversation_id
+            last_request_id = chunk.request_id
+            yield sse_frame(
+                ChatEvent.json_from_chunk(chunk), event_type_for_chunk(chunk)
+            )
+
+        done_json = ChatEvent.done_json(last_conversation_id, last_request_id)
+        yield sse_frame(done_json, "done")
+    except ConnectionResetError:
+        raise
+    except Exception as e:
+        logger.exception("v3 chat event stream failed")
+        error_event = ChatEvent(
+            event_type="error",
+            conversation_id=last_conversation_id,
+            request_id=last_request_id,
+            payload={"message": str(e)},
+        )
+        yield sse_frame(
+            error_event.__pydantic_serializer__.to_json(error_event), "error"
+        )
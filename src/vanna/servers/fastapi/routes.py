@@ -2,22 +2,144 @@
 FastAPI route implementations for Vanna Agents.
 """
 
+import asyncio
+import hashlib
 import json
-import traceback
+import logging
+import secrets
 import uuid
 import inspect
-from typing import Any, AsyncGenerator, Dict, Optional, Callable, Awaitable
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
 
 from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import StreamingResponse, HTMLResponse
-
-from ..base import ChatHandler, ChatRequest, ChatResponse
-from ..base.events_v3 import ChatEvent
+from fastapi.requests import HTTPConnection
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
+from pydantic_core import from_json
+
+from ..base import ChatHandler, ChatRequest, ChatResponse, ChatStreamChunk
+from ..base.events_v3 import ChatEvent, event_type_for_chunk, poll_response_json
+from ..base.schema_metadata import SchemaMetadataCache
+from ..base.sse import chat_events_v3_stream, chat_sse_stream
 from ..base.templates import get_index_html
 from ...core.user.request_context import RequestContext
 from ...core.tool import ToolContext
 from ...services.feedback import FeedbackRequest
 
+logger = logging.getLogger(__name__)
+
+# Raised when the client goes away mid-stream. These are routine (a browser
+# tab closing) and are re-raised without logging or error frames.
+_CLIENT_DISCONNECTS = (
+    asyncio.CancelledError,
+    ConnectionResetError,
+    WebSocketDisconnect,
+)
+
+
+def _request_context(
+    connection: HTTPConnection, metadata: Dict[str, Any]
+) -> RequestContext:
+    """Build the ``RequestContext`` for an HTTP or WebSocket connection.
+
+    Headers are copied with ``dict(headers)`` so a repeated header keeps its
+    first value, and the already-typed values skip a second, validating copy
+    in ``RequestContext``.
+    """
+    return RequestContext.model_construct(
+        cookies=dict(connection.cookies),
+        headers=dict(connection.headers),
+        remote_addr=connection.client.host if connection.client else None,
+        query_params=dict(connection.query_params.items()),
+        metadata=metadata,
+    )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an ``If-None-Match`` header matches ``etag``.
+
+    Uses the weak comparison RFC 9110 prescribes for ``If-None-Match``: the
+    header may list several tags or be ``*``, and ``W/`` prefixes are ignored.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def _merge_metadata(base: Dict[str, Any], extra: Dict[str, Any]) -> Dict[str, Any]:
+    """Overlay ``extra`` onto a copy of ``base``, reusing ``base`` if empty."""
+    if not extra:
+        return base
+    merged = base.copy()
+    merged.update(extra)
+    return merged
+
+
+async def _send_chunks_batched(
+    websocket: WebSocket,
+    chunks: AsyncIterator[ChatStreamChunk],
+    max_wait_s: float,
+    max_batch_size: int,
+) -> Optional[ChatStreamChunk]:
+    """Stream chunks over a WebSocket, coalescing them into batched frames.
+
+    Chunks are buffered until ``max_batch_size`` is reached or ``max_wait_s``
+    has elapsed since the first buffered chunk, then sent as a single
+    ``{"batch": [...]}`` text frame.
+
+    Returns:
+        The last chunk sent, or None if the stream was empty
+    """
+    loop = asyncio.get_running_loop()
+    buffer: List[str] = []
+    deadline = 0.0
+    last_chunk: Optional[ChatStreamChunk] = None
+    pending: Optional["asyncio.Future[ChatStreamChunk]"] = None
+
+    async def flush() -> None:
+        if buffer:
+            await websocket.send_text('{"batch":[' + ",".join(buffer) + "]}")
+            buffer.clear()
+
+    try:
+        while True:
+            if pending is None:
+                # Keep the pending __anext__ across flushes; cancelling it on
+                # timeout would tear down the underlying generator.
+                pending = asyncio.ensure_future(chunks.__anext__())
+            timeout = max(deadline - loop.time(), 0.0) if buffer else None
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if pending in done:
+                finished, pending = pending, None
+                try:
+                    last_chunk = finished.result()
+                except StopAsyncIteration:
+                    break
+                if not buffer:
+                    deadline = loop.time() + max_wait_s
+                buffer.append(last_chunk.model_dump_json())
+                if len(buffer) < max_batch_size:
+                    continue
+            await flush()
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+    await flush()
+    return last_chunk
+
 
 def register_chat_routes(
     app: FastAPI, chat_handler: ChatHandler, config: Optional[Dict[str, Any]] = None
@@ -33,9 +155,15 @@ def register_chat_routes(
     v2_prefix = config.get("api_v2_prefix", "/api/vanna/v2")
     v3_prefix = config.get("api_v3_prefix", "/api/vanna/v3")
     enable_default_ui_route = config.get("enable_default_ui_route", True)
+    websocket_batch_wait_s = config.get("websocket_batch_wait_s", 0.01)
+    websocket_max_batch_size = config.get("websocket_max_batch_size", 16)
     request_guard: Optional[
         Callable[[ChatRequest, RequestContext], Optional[Awaitable[None]]]
     ] = config.get("request_guard")
+    schema_metadata = SchemaMetadataCache(
+        config.get("schema_sync_service"),
+        ttl_s=config.get("schema_metadata_ttl_s", 5.0),
+    )
 
     async def _run_request_guard(
         chat_request: ChatRequest, request_context: RequestContext
@@ -54,77 +182,74 @@ def register_chat_routes(
         user = await chat_handler.agent.user_resolver.resolve_user(request_context)
         return ToolContext(
             user=user,
-            conversation_id=conversation_id or f"conv_{uuid.uuid4().hex[:8]}",
+            conversation_id=conversation_id or "conv_" + secrets.token_hex(4),
             request_id=request_id or str(uuid.uuid4()),
             agent_memory=chat_handler.agent.agent_memory,
             metadata={"schema_sync": True},
         )
 
+    async def _guard_and_build_tool_context(
+        request_context: RequestContext,
+        conversation_id: Optional[str] = None,
+        request_id: Optional[str] = None,
+    ) -> ToolContext:
+        """Run the request guard, then resolve the user into a ToolContext.
+
+        The guard runs first, as in the Flask server, so rejected requests
+        never reach the user resolver.
+        """
+        dummy_request = ChatRequest(message="", request_context=request_context)
+        await _run_request_guard(dummy_request, request_context)
+        return await _build_tool_context(request_context, conversation_id, request_id)
+
     async def _load_schema_metadata() -> Dict[str, Any]:
-        service = config.get("schema_sync_service")
-        if service is None:
-            return {}
-        latest = await service.get_latest_snapshot()
-        if latest is None:
-            return {}
-        return {
-            "schema_hash": latest.schema_hash,
-            "schema_snapshot_id": latest.snapshot_id,
-        }
+        return await schema_metadata.get()
+
+    async def _prepare_chat_request(
+        chat_request: ChatRequest, http_request: Request
+    ) -> ChatRequest:
+        """Return a copy of the parsed request with metadata and context set.
+
+        Built with a single ``model_copy`` rather than mutating the parsed
+        model field by field.
+        """
+        merged_metadata = _merge_metadata(
+            chat_request.metadata, await _load_schema_metadata()
+        )
+        # Extract request context for user resolution
+        request_context = _request_context(http_request, merged_metadata)
+        return chat_request.model_copy(
+            update={"metadata": merged_metadata, "request_context": request_context}
+        )
 
     if enable_default_ui_route:
+        # The page depends only on config, so render it once.
+        index_html = get_index_html(
+            dev_mode=config.get("dev_mode", False),
+            cdn_url=config.get("cdn_url", "https://img.vanna.ai/vanna-components.js"),
+            api_base_url=config.get("api_base_url", ""),
+            api_v2_prefix=v2_prefix,
+        ).encode("utf-8")
+        index_etag = f'"{hashlib.blake2b(index_html, digest_size=8).hexdigest()}"'
 
         @app.get("/", response_class=HTMLResponse)
-        async def index() -> str:
+        async def index(http_request: Request) -> Response:
             """Serve the main chat interface."""
-            dev_mode = config.get("dev_mode", False)
-            cdn_url = config.get("cdn_url", "https://img.vanna.ai/vanna-components.js")
-            api_base_url = config.get("api_base_url", "")
-
-            return get_index_html(
-                dev_mode=dev_mode,
-                cdn_url=cdn_url,
-                api_base_url=api_base_url,
-                api_v2_prefix=v2_prefix,
-            )
+            headers = {"ETag": index_etag}
+            if _etag_matches(http_request.headers.get("if-none-match"), index_etag):
+                return Response(status_code=304, headers=headers)
+            return HTMLResponse(index_html, headers=headers)
 
     @app.post(f"{v2_prefix}/chat_sse")
     async def chat_sse(
         chat_request: ChatRequest, http_request: Request
     ) -> StreamingResponse:
         """Server-Sent Events endpoint for streaming chat."""
-        merged_metadata = {**chat_request.metadata, **(await _load_schema_metadata())}
-        chat_request.metadata = merged_metadata
-        # Extract request context for user resolution
-        chat_request.request_context = RequestContext(
-            cookies=dict(http_request.cookies),
-            headers=dict(http_request.headers),
-            remote_addr=http_request.client.host if http_request.client else None,
-            query_params=dict(http_request.query_params),
-            metadata=merged_metadata,
-        )
+        chat_request = await _prepare_chat_request(chat_request, http_request)
         await _run_request_guard(chat_request, chat_request.request_context)
 
-        async def generate() -> AsyncGenerator[str, None]:
-            """Generate SSE stream."""
-            try:
-                async for chunk in chat_handler.handle_stream(chat_request):
-                    chunk_json = chunk.model_dump_json()
-                    yield f"data: {chunk_json}\n\n"
-                yield "data: [DONE]\n\n"
-            except Exception as e:
-                traceback.print_stack()
-                traceback.print_exc()
-                error_data = {
-                    "type": "error",
-                    "data": {"message": str(e)},
-                    "conversation_id": chat_request.conversation_id or "",
-                    "request_id": chat_request.request_id or "",
-                }
-                yield f"data: {json.dumps(error_data)}\n\n"
-
         return StreamingResponse(
-            generate(),
+            chat_sse_stream(chat_handler, chat_request),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -138,44 +263,11 @@ def register_chat_routes(
         chat_request: ChatRequest, http_request: Request
     ) -> StreamingResponse:
         """Versioned v3 SSE endpoint with typed events."""
-        merged_metadata = {**chat_request.metadata, **(await _load_schema_metadata())}
-        chat_request.metadata = merged_metadata
-        chat_request.request_context = RequestContext(
-            cookies=dict(http_request.cookies),
-            headers=dict(http_request.headers),
-            remote_addr=http_request.client.host if http_request.client else None,
-            query_params=dict(http_request.query_params),
-            metadata=merged_metadata,
-        )
+        chat_request = await _prepare_chat_request(chat_request, http_request)
         await _run_request_guard(chat_request, chat_request.request_context)
 
-        async def generate() -> AsyncGenerator[str, None]:
-            last_conversation_id = chat_request.conversation_id or ""
-            last_request_id = chat_request.request_id or ""
-            try:
-                async for chunk in chat_handler.handle_stream(chat_request):
-                    last_conversation_id = chunk.conversation_id
-                    last_request_id = chunk.request_id
-                    event = ChatEvent.from_chunk(chunk)
-                    event_json = event.model_dump_json()
-                    yield f"event: {event.event_type}\n"
-                    yield f"data: {event_json}\n\n"
-
-                done_event = ChatEvent.done(last_conversation_id, last_request_id)
-                yield "event: done\n"
-                yield f"data: {done_event.model_dump_json()}\n\n"
-            except Exception as e:
-                error_event = ChatEvent(
-                    event_type="error",
-                    conversation_id=last_conversation_id,
-                    request_id=last_request_id,
-                    payload={"message": str(e)},
-                )
-                yield "event: error\n"
-                yield f"data: {error_event.model_dump_json()}\n\n"
-
         return StreamingResponse(
-            generate(),
+            chat_events_v3_stream(chat_handler, chat_request),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -187,32 +279,29 @@ def register_chat_routes(
     @app.post(f"{v3_prefix}/chat/poll")
     async def chat_poll_v3(
         chat_request: ChatRequest, http_request: Request
-    ) -> Dict[str, Any]:
+    ) -> Response:
         """Versioned v3 polling endpoint returning typed events."""
-        merged_metadata = {**chat_request.metadata, **(await _load_schema_metadata())}
-        chat_request.metadata = merged_metadata
-        chat_request.request_context = RequestContext(
-            cookies=dict(http_request.cookies),
-            headers=dict(http_request.headers),
-            remote_addr=http_request.client.host if http_request.client else None,
-            query_params=dict(http_request.query_params),
-            metadata=merged_metadata,
-        )
+        chat_request = await _prepare_chat_request(chat_request, http_request)
         await _run_request_guard(chat_request, chat_request.request_context)
 
-        events = []
+        first_chunk: Optional[ChatStreamChunk] = None
+        parts: List[bytes] = []
         async for chunk in chat_handler.handle_stream(chat_request):
-            events.append(ChatEvent.from_chunk(chunk).model_dump())
+            if first_chunk is None:
+                first_chunk = chunk
+            parts.append(ChatEvent.json_from_chunk(chunk))
 
-        if events:
-            conversation_id = events[0]["conversation_id"]
-            request_id = events[0]["request_id"]
-            events.append(ChatEvent.done(conversation_id, request_id).model_dump())
+        if first_chunk is not None:
+            parts.append(
+                ChatEvent.done_json(first_chunk.conversation_id, first_chunk.request_id)
+            )
 
-        return {"event_version": "v3", "events": events}
+        return Response(
+            content=poll_response_json(parts), media_type="application/json"
+        )
 
     @app.post(f"{v3_prefix}/schema/sync")
-    async def schema_sync(http_request: Request) -> Dict[str, Any]:
+    async def schema_sync(http_request: Request) -> Response:
         """Trigger on-demand schema sync and drift detection."""
         service = config.get("schema_sync_service")
         if service is None:
@@ -220,21 +309,17 @@ def register_chat_routes(
                 status_code=501, detail="Schema sync service is not configured."
             )
 
-        request_context = RequestContext(
-            cookies=dict(http_request.cookies),
-            headers=dict(http_request.headers),
-            remote_addr=http_request.client.host if http_request.client else None,
-            query_params=dict(http_request.query_params),
-            metadata={},
-        )
-        dummy_request = ChatRequest(message="", request_context=request_context)
-        await _run_request_guard(dummy_request, request_context)
-        tool_context = await _build_tool_context(request_context)
+        request_context = _request_context(http_request, {})
+        tool_context = await _guard_and_build_tool_context(request_context)
         result = await service.sync(tool_context)
-        return result.model_dump(mode="json")
+        schema_metadata.invalidate()
+        return Response(
+            content=result.__pydantic_serializer__.to_json(result),
+            media_type="application/json",
+        )
 
     @app.get(f"{v3_prefix}/schema/status")
-    async def schema_status() -> Dict[str, Any]:
+    async def schema_status() -> Response:
         """Return latest known schema snapshot metadata."""
         service = config.get("schema_sync_service")
         if service is None:
@@ -243,13 +328,18 @@ def register_chat_routes(
             )
         latest = await service.get_latest_snapshot()
         if latest is None:
-            return {"status": "empty", "snapshot": None}
-        return {"status": "ok", "snapshot": latest.model_dump(mode="json")}
+            body = b'{"status":"empty","snapshot":null}'
+        else:
+            # Serialize the snapshot once in pydantic-core instead of dumping
+            # to dicts and re-encoding through jsonable_encoder.
+            snapshot_json = latest.__pydantic_serializer__.to_json(latest)
+            body = b'{"status":"ok","snapshot":' + snapshot_json + b"}"
+        return Response(content=body, media_type="application/json")
 
     @app.post(f"{v3_prefix}/feedback")
     async def feedback(
         feedback_request: FeedbackRequest, http_request: Request
-    ) -> Dict[str, Any]:
+    ) -> Response:
         """Capture feedback and apply immediate memory patches."""
         feedback_service = config.get("feedback_service")
         if feedback_service is None:
@@ -257,51 +347,53 @@ def register_chat_routes(
                 status_code=501, detail="Feedback service is not configured."
             )
 
-        request_context = RequestContext(
-            cookies=dict(http_request.cookies),
-            headers=dict(http_request.headers),
-            remote_addr=http_request.client.host if http_request.client else None,
-            query_params=dict(http_request.query_params),
-            metadata={},
-        )
-        dummy_request = ChatRequest(message="", request_context=request_context)
-        await _run_request_guard(dummy_request, request_context)
-
-        tool_context = await _build_tool_context(
+        request_context = _request_context(http_request, {})
+        tool_context = await _guard_and_build_tool_context(
             request_context=request_context,
             conversation_id=feedback_request.conversation_id,
             request_id=feedback_request.request_id,
         )
         result = await feedback_service.process_feedback(feedback_request, tool_context)
-        return result.model_dump(mode="json")
+        return Response(
+            content=result.__pydantic_serializer__.to_json(result),
+            media_type="application/json",
+        )
 
     @app.websocket(f"{v2_prefix}/chat_websocket")
     async def chat_websocket(websocket: WebSocket) -> None:
-        """WebSocket endpoint for real-time chat."""
+        """WebSocket endpoint for real-time chat.
+
+        Clients connecting with ``?batch=1`` receive chunks coalesced into
+        ``{"batch": [...]}`` frames instead of one frame per chunk.
+        """
         await websocket.accept()
+        batch_enabled = websocket.query_params.get("batch", "").lower() in (
+            "1",
+            "true",
+        )
 
         try:
             while True:
                 # Receive message
                 try:
-                    data = await websocket.receive_json()
+                    # Parse with pydantic-core's single-pass JSON parser and
+                    # validate the resulting dict once, rather than json.loads
+                    # followed by keyword-argument construction.
+                    data = from_json(await websocket.receive_text())
 
                     # Extract request context for user resolution
-                    metadata = data.get("metadata", {})
-                    metadata = {**metadata, **(await _load_schema_metadata())}
-                    data["request_context"] = RequestContext(
-                        cookies=dict(websocket.cookies),
-                        headers=dict(websocket.headers),
-                        remote_addr=websocket.client.host if websocket.client else None,
-                        query_params=dict(websocket.query_params),
-                        metadata=metadata,
+                    metadata = _merge_metadata(
+                        data.get("metadata") or {}, await _load_schema_metadata()
                     )
+                    data["metadata"] = metadata
+                    data["request_context"] = _request_context(websocket, metadata)
 
-                    chat_request = ChatRequest(**data)
+                    chat_request = ChatRequest.model_validate(data)
                     await _run_request_guard(chat_request, chat_request.request_context)
+                except _CLIENT_DISCONNECTS:
+                    raise
                 except Exception as e:
-                    traceback.print_stack()
-                    traceback.print_exc()
+                    logger.warning("Rejected WebSocket chat request: %s", e)
                     await websocket.send_json(
                         {
                             "type": "error",
@@ -312,26 +404,35 @@ def register_chat_routes(
 
                 # Stream response
                 try:
-                    async for chunk in chat_handler.handle_stream(chat_request):
-                        await websocket.send_json(chunk.model_dump())
+                    last_chunk: Optional[ChatStreamChunk] = None
+                    if batch_enabled:
+                        last_chunk = await _send_chunks_batched(
+                            websocket,
+                            chat_handler.handle_stream(chat_request),
+                            websocket_batch_wait_s,
+                            websocket_max_batch_size,
+                        )
+                    else:
+                        async for chunk in chat_handler.handle_stream(chat_request):
+                            await websocket.send_text(chunk.model_dump_json())
+                            last_chunk = chunk
 
                     # Send completion signal
                     await websocket.send_json(
                         {
                             "type": "completion",
                             "data": {"status": "done"},
-                            "conversation_id": chunk.conversation_id
-                            if "chunk" in locals()
-                            else "",
-                            "request_id": chunk.request_id
-                            if "chunk" in locals()
+                            "conversation_id": last_chunk.conversation_id
+                            if last_chunk
                             else "",
+                            "request_id": last_chunk.request_id if last_chunk else "",
                         }
                     )
 
+                except _CLIENT_DISCONNECTS:
+                    raise
                 except Exception as e:
-                    traceback.print_stack()
-                    traceback.print_exc()
+                    logger.exception("WebSocket chat stream failed")
                     await websocket.send_json(
                         {
                             "type": "error",
@@ -341,11 +442,10 @@ def register_chat_routes(
                         }
                     )
 
-        except WebSocketDisconnect:
+        except (WebSocketDisconnect, ConnectionResetError):
             pass
         except Exception as e:
-            traceback.print_stack()
-            traceback.print_exc()
+            logger.exception("WebSocket connection failed")
             try:
                 await websocket.send_json(
                     {
@@ -358,27 +458,18 @@ def register_chat_routes(
             finally:
                 await websocket.close()
 
-    @app.post(f"{v2_prefix}/chat_poll")
-    async def chat_poll(
-        chat_request: ChatRequest, http_request: Request
-    ) -> ChatResponse:
+    @app.post(f"{v2_prefix}/chat_poll", response_model=ChatResponse)
+    async def chat_poll(chat_request: ChatRequest, http_request: Request) -> Response:
         """Polling endpoint for chat."""
-        merged_metadata = {**chat_request.metadata, **(await _load_schema_metadata())}
-        chat_request.metadata = merged_metadata
-        # Extract request context for user resolution
-        chat_request.request_context = RequestContext(
-            cookies=dict(http_request.cookies),
-            headers=dict(http_request.headers),
-            remote_addr=http_request.client.host if http_request.client else None,
-            query_params=dict(http_request.query_params),
-            metadata=merged_metadata,
-        )
+        chat_request = await _prepare_chat_request(chat_request, http_request)
         await _run_request_guard(chat_request, chat_request.request_context)
 
         try:
             result = await chat_handler.handle_poll(chat_request)
-            return result
+            return Response(
+                content=result.__pydantic_serializer__.to_json(result),
+                media_type="application/json",
+            )
         except Exception as e:
-            traceback.print_stack()
-            traceback.print_exc()
+            logger.exception("Chat poll failed")
             raise HTTPException(status_code=500, detail=f"Chat failed: {str(e)}")
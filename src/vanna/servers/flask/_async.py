@@ -7,33 +7,188 @@ the fragile per-request ``asyncio.new_event_loop()`` pattern.
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import contextlib
+import queue
 import threading
-from typing import Any, AsyncGenerator, Coroutine, Generator, Iterator, TypeVar
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Coroutine,
+    Generator,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 _T = TypeVar("_T")
 
-_loop = asyncio.new_event_loop()
-_thread = threading.Thread(target=_loop.run_forever, name="vanna-async", daemon=True)
-_thread.start()
+# Message kinds passed from the pump task to the consuming thread.
+_ITEM, _END, _ERROR = range(3)
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a uvloop loop when installed, else a default asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+class LoopThread:
+    """An event loop running forever on a daemon thread.
+
+    The loop and its thread are created on first use, so importing the Flask
+    server does not spawn a thread until a request actually needs the loop.
+    """
+
+    def __init__(self, name: str = "vanna-async") -> None:
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The background loop, started on first access."""
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = _new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever, name=self._name, daemon=True
+                    ).start()
+                    self._loop = loop
+        return self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, _T]) -> concurrent.futures.Future[_T]:
+        """Schedule a coroutine on the background loop."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+
+loop_thread = LoopThread()
 
 
 def run_async(coro: Coroutine[Any, Any, _T]) -> _T:
     """Run a coroutine to completion on the shared background loop."""
-    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+    return loop_thread.submit(coro).result()
+
+
+# How many items the pump may get ahead of the consuming thread.
+_MAX_PENDING = 64
+
+
+@contextlib.contextmanager
+def _pumped(
+    agen: AsyncGenerator[_T, None],
+    max_pending: int = _MAX_PENDING,
+) -> Iterator[Callable[[Optional[float]], Tuple[int, Any]]]:
+    """Drive ``agen`` from a pump task on the shared loop.
+
+    Yields a ``take(timeout)`` function returning the next ``(kind, value)``
+    message. The pump stays at most ``max_pending`` items ahead of the
+    consumer, so a slow client still applies backpressure to the generator.
+    Every way the pump can finish queues an ``_END`` or ``_ERROR`` message,
+    so the consumer never blocks forever. On exit the task is cancelled and
+    awaited, so the generator's cleanup has run by the time this returns.
+    """
+    items: "queue.SimpleQueue[Tuple[int, Any]]" = queue.SimpleQueue()
+    loop = loop_thread.loop
+
+    async def pump(slots: asyncio.Semaphore) -> None:
+        try:
+            async for item in agen:
+                await slots.acquire()
+                items.put((_ITEM, item))
+            items.put((_END, None))
+        except BaseException as exc:
+            items.put((_ERROR, exc))
+            if not isinstance(exc, Exception):
+                raise
+        finally:
+            await agen.aclose()
+
+    async def start() -> "Tuple[asyncio.Task[None], asyncio.Semaphore]":
+        # Created on the loop so the semaphore binds to it on Python 3.9.
+        slots = asyncio.Semaphore(max_pending)
+        return asyncio.ensure_future(pump(slots)), slots
+
+    async def stop(task: "asyncio.Task[None]") -> None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    task, slots = run_async(start())
+
+    def take(timeout: Optional[float] = None) -> Tuple[int, Any]:
+        message = items.get(timeout=timeout)
+        if message[0] == _ITEM:
+            loop.call_soon_threadsafe(slots.release)
+        return message
+
+    try:
+        yield take
+    finally:
+        run_async(stop(task))
 
 
 def iter_async(agen: AsyncGenerator[_T, None]) -> Iterator[_T]:
     """Iterate an async generator synchronously via the shared loop.
 
+    The generator is driven by a single pump task on the shared loop, which
+    hands items to this thread through a queue, so it lives on one task for
+    its whole life and costs no per-item cross-thread round trip.
+
     Closes the underlying async generator on exit — including when the consumer
     stops early (e.g. an SSE client disconnects and Flask closes this
     generator) — so it doesn't leak suspended on the shared loop.
     """
-    try:
+    with _pumped(agen) as take:
         while True:
-            try:
-                yield asyncio.run_coroutine_threadsafe(agen.__anext__(), _loop).result()
-            except StopAsyncIteration:
+            kind, value = take(None)
+            if kind == _ITEM:
+                yield value
+            elif kind == _ERROR:
+                raise value
+            else:
                 return
-    finally:
-        asyncio.run_coroutine_threadsafe(agen.aclose(), _loop).result()
+
+
+def iter_async_coalesced(
+    agen: AsyncGenerator[bytes, None],
+    max_bytes: int = 8192,
+    flush_after_s: float = 0.02,
+) -> Iterator[bytes]:
+    """Like ``iter_async`` for byte streams, merging items into fewer writes.
+
+    Items are buffered while the producer keeps up; the buffer is flushed once
+    it reaches ``max_bytes``, when no new item arrives within
+    ``flush_after_s``, and at the end of the stream.
+    """
+    buffer = bytearray()
+    with _pumped(agen) as take:
+        while True:
+            try:
+                kind, value = take(flush_after_s if buffer else None)
+            except queue.Empty:
+                # Producer is idle; don't hold back what we have.
+                yield bytes(buffer)
+                buffer.clear()
+                continue
+
+            if kind == _ITEM:
+                buffer += value
+                if len(buffer) >= max_bytes:
+                    yield bytes(buffer)
+                    buffer.clear()
+                continue
+
+            if buffer:
+                yield bytes(buffer)
+            if kind == _ERROR:
+                raise value
+            return
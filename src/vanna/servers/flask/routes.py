@@ -2,22 +2,85 @@
 Flask route implementations for Vanna Agents.
 """
 
+import hashlib
 import json
-import traceback
+import logging
+import secrets
 import uuid
 import inspect
-from typing import Any, AsyncGenerator, Dict, Generator, Optional, Union, Callable
-
-from flask import Flask, Response, jsonify, request
-
-from ._async import run_async, iter_async
-from ..base import ChatHandler, ChatRequest
-from ..base.events_v3 import ChatEvent
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Union,
+)
+
+from flask import Flask, Response, request
+from pydantic_core import from_json, to_json
+
+from ._async import iter_async_coalesced, loop_thread, run_async
+from ..base import ChatHandler, ChatRequest, ChatStreamChunk
+from ..base.events_v3 import ChatEvent, event_type_for_chunk, poll_response_json
+from ..base.schema_metadata import SchemaMetadataCache
+from ..base.sse import chat_events_v3_stream, chat_sse_stream
 from ..base.templates import get_index_html
+from ...agents.basic import SimpleUserResolver
 from ...core.user.request_context import RequestContext
 from ...core.tool import ToolContext
 from ...services.feedback import FeedbackRequest
 
+logger = logging.getLogger(__name__)
+
+
+def _json_response(payload: Any, status: int = 200) -> Response:
+    """Serialize ``payload`` straight to a JSON bytes response."""
+    return Response(to_json(payload), status=status, mimetype="application/json")
+
+
+def _error_response(message: str, status: int) -> Response:
+    """Build a ``{"error": message}`` JSON response."""
+    return _json_response({"error": message}, status)
+
+
+def _json_body() -> Any:
+    """Parse the request body as JSON, or return None if it isn't JSON.
+
+    The raw body is parsed directly with pydantic-core rather than through
+    ``request.get_json()`` and is not kept cached on the request.
+    """
+    if not request.is_json:
+        return None
+    return from_json(request.get_data(cache=False))
+
+
+def _request_context(metadata: Dict[str, Any]) -> RequestContext:
+    """Build the ``RequestContext`` for the current Flask request.
+
+    Headers are copied with ``dict(headers)`` so a repeated header keeps its
+    first value, and the already-typed values skip a second, validating copy
+    in ``RequestContext``.
+    """
+    return RequestContext.model_construct(
+        cookies=request.cookies.to_dict(),
+        headers=dict(request.headers),
+        remote_addr=request.remote_addr,
+        query_params=request.args.to_dict(),
+        metadata=metadata,
+    )
+
+
+def _merge_metadata(base: Dict[str, Any], extra: Dict[str, Any]) -> Dict[str, Any]:
+    """Overlay ``extra`` onto a copy of ``base``, reusing ``base`` if empty."""
+    if not extra:
+        return base
+    merged = base.copy()
+    merged.update(extra)
+    return merged
+
 
 def register_chat_routes(
     app: Flask, chat_handler: ChatHandler, config: Optional[Dict[str, Any]] = None
@@ -36,93 +99,97 @@ def register_chat_routes(
     request_guard: Optional[Callable[[ChatRequest, RequestContext], Any]] = config.get(
         "request_guard"
     )
+    guard_is_async = inspect.iscoroutinefunction(request_guard)
+    sse_max_buffer_bytes = config.get("sse_max_buffer_bytes", 8192)
+    sse_flush_after_s = config.get("sse_flush_after_s", 0.02)
+    # Expose the shared background loop so app code can schedule coroutines
+    # (e.g. on shared async clients) on the same loop the routes use.
+    app.extensions.setdefault("vanna_loop", loop_thread)
+    schema_metadata_service = config.get("schema_sync_service")
+    schema_metadata = SchemaMetadataCache(
+        schema_metadata_service, ttl_s=config.get("schema_metadata_ttl_s", 5.0)
+    )
 
     def _run_request_guard(chat_request: ChatRequest, request_context: RequestContext):
         if request_guard is None:
             return
+        if guard_is_async:
+            run_async(request_guard(chat_request, request_context))
+            return
         result = request_guard(chat_request, request_context)
         if inspect.isawaitable(result):
+            # Sync callable that hands back an awaitable.
             run_async(result)
 
     def _build_tool_context(request_context: RequestContext) -> ToolContext:
-        user = run_async(chat_handler.agent.user_resolver.resolve_user(request_context))
+        resolver = chat_handler.agent.user_resolver
+        if type(resolver).resolve_user is SimpleUserResolver.resolve_user:
+            # Always the same user; skip the hop to the background loop.
+            user = resolver.default_user
+        else:
+            user = run_async(resolver.resolve_user(request_context))
         return ToolContext(
             user=user,
-            conversation_id=f"conv_{uuid.uuid4().hex[:8]}",
+            conversation_id="conv_" + secrets.token_hex(4),
             request_id=str(uuid.uuid4()),
             agent_memory=chat_handler.agent.agent_memory,
             metadata={"schema_sync": True},
         )
 
     def _load_schema_metadata_sync() -> Dict[str, Any]:
-        service = config.get("schema_sync_service")
-        if service is None:
-            return {}
-
-        latest = run_async(service.get_latest_snapshot())
-
-        if latest is None:
+        if schema_metadata_service is None:
             return {}
-        return {
-            "schema_hash": latest.schema_hash,
-            "schema_snapshot_id": latest.snapshot_id,
-        }
+        # Serve fresh cached metadata without a hop to the background loop.
+        cached = schema_metadata.fresh_value()
+        if cached is not None:
+            return cached
+        return run_async(schema_metadata.get())
 
     if enable_default_ui_route:
+        # The page depends only on config, so render it once.
+        index_html = get_index_html(
+            dev_mode=config.get("dev_mode", False),
+            cdn_url=config.get("cdn_url", "https://img.vanna.ai/vanna-components.js"),
+            api_base_url=config.get("api_base_url", ""),
+            api_v2_prefix=v2_prefix,
+        ).encode("utf-8")
+        index_etag = hashlib.blake2b(index_html, digest_size=8).hexdigest()
 
         @app.route("/")
-        def index() -> str:
+        def index() -> Response:
             """Serve the main chat interface."""
-            dev_mode = config.get("dev_mode", False)
-            cdn_url = config.get("cdn_url", "https://img.vanna.ai/vanna-components.js")
-            api_base_url = config.get("api_base_url", "")
-
-            return get_index_html(
-                dev_mode=dev_mode,
-                cdn_url=cdn_url,
-                api_base_url=api_base_url,
-                api_v2_prefix=v2_prefix,
-            )
+            response = Response(index_html, mimetype="text/html")
+            response.set_etag(index_etag)
+            return response.make_conditional(request)
 
     @app.route(f"{v2_prefix}/chat_sse", methods=["POST"])
     def chat_sse() -> Union[Response, tuple[Response, int]]:
         """Server-Sent Events endpoint for streaming chat."""
         try:
-            data = request.get_json()
+            data = _json_body()
             if not data:
-                return jsonify({"error": "JSON body required"}), 400
-            data["metadata"] = {
-                **data.get("metadata", {}),
-                **_load_schema_metadata_sync(),
-            }
+                return _error_response("JSON body required", 400)
+            metadata = _merge_metadata(
+                data.get("metadata") or {}, _load_schema_metadata_sync()
+            )
+            data["metadata"] = metadata
 
             # Extract request context for user resolution
-            data["request_context"] = RequestContext(
-                cookies=dict(request.cookies),
-                headers=dict(request.headers),
-                remote_addr=request.remote_addr,
-                query_params=dict(request.args),
-                metadata=data.get("metadata", {}),
-            )
+            data["request_context"] = _request_context(metadata)
 
-            chat_request = ChatRequest(**data)
+            chat_request = ChatRequest.model_validate(data)
             _run_request_guard(chat_request, chat_request.request_context)
         except Exception as e:
-            traceback.print_stack()
-            traceback.print_exc()
-            return jsonify({"error": f"Invalid request: {str(e)}"}), 400
+            logger.warning("Rejected chat_sse request: %s", e)
+            return _error_response(f"Invalid request: {str(e)}", 400)
 
-        def generate() -> Generator[str, None, None]:
+        def generate() -> Generator[bytes, None, None]:
             """Generate SSE stream."""
-
-            async def async_generate() -> AsyncGenerator[str, None]:
-                async for chunk in chat_handler.handle_stream(chat_request):
-                    chunk_json = chunk.model_dump_json()
-                    yield f"data: {chunk_json}\n\n"
-
-            for chunk in iter_async(async_generate()):
-                yield chunk
-            yield "data: [DONE]\n\n"
+            yield from iter_async_coalesced(
+                chat_sse_stream(chat_handler, chat_request),
+                sse_max_buffer_bytes,
+                sse_flush_after_s,
+            )
 
         return Response(
             generate(),
@@ -138,47 +205,27 @@ def register_chat_routes(
     def chat_events_v3() -> Union[Response, tuple[Response, int]]:
         """Versioned v3 SSE endpoint with typed events."""
         try:
-            data = request.get_json()
+            data = _json_body()
             if not data:
-                return jsonify({"error": "JSON body required"}), 400
-            data["metadata"] = {
-                **data.get("metadata", {}),
-                **_load_schema_metadata_sync(),
-            }
-
-            data["request_context"] = RequestContext(
-                cookies=dict(request.cookies),
-                headers=dict(request.headers),
-                remote_addr=request.remote_addr,
-                query_params=dict(request.args),
-                metadata=data.get("metadata", {}),
+                return _error_response("JSON body required", 400)
+            metadata = _merge_metadata(
+                data.get("metadata") or {}, _load_schema_metadata_sync()
             )
-            chat_request = ChatRequest(**data)
+            data["metadata"] = metadata
+
+            data["request_context"] = _request_context(metadata)
+            chat_request = ChatRequest.model_validate(data)
             _run_request_guard(chat_request, chat_request.request_context)
         except Exception as e:
-            traceback.print_stack()
-            traceback.print_exc()
-            return jsonify({"error": f"Invalid request: {str(e)}"}), 400
-
-        def generate() -> Generator[str, None, None]:
-            last_conversation_id = chat_request.conversation_id or ""
-            last_request_id = chat_request.request_id or ""
-
-            async def async_generate() -> AsyncGenerator[str, None]:
-                nonlocal last_conversation_id, last_request_id
-                async for chunk in chat_handler.handle_stream(chat_request):
-                    last_conversation_id = chunk.conversation_id
-                    last_request_id = chunk.request_id
-                    event = ChatEvent.from_chunk(chunk)
-                    event_json = event.model_dump_json()
-                    yield f"event: {event.event_type}\n"
-                    yield f"data: {event_json}\n\n"
-
-            for chunk in iter_async(async_generate()):
-                yield chunk
-            done = ChatEvent.done(last_conversation_id, last_request_id)
-            yield "event: done\n"
-            yield f"data: {done.model_dump_json()}\n\n"
+            logger.warning("Rejected chat_events_v3 request: %s", e)
+            return _error_response(f"Invalid request: {str(e)}", 400)
+
+        def generate() -> Generator[bytes, None, None]:
+            yield from iter_async_coalesced(
+                chat_events_v3_stream(chat_handler, chat_request),
+                sse_max_buffer_bytes,
+                sse_flush_after_s,
+            )
 
         return Response(
             generate(),
@@ -194,113 +241,103 @@ def register_chat_routes(
     def chat_poll_v3() -> Union[Response, tuple[Response, int]]:
         """Versioned v3 polling endpoint returning typed events."""
         try:
-            data = request.get_json()
+            data = _json_body()
             if not data:
-                return jsonify({"error": "JSON body required"}), 400
-            data["metadata"] = {
-                **data.get("metadata", {}),
-                **_load_schema_metadata_sync(),
-            }
-
-            data["request_context"] = RequestContext(
-                cookies=dict(request.cookies),
-                headers=dict(request.headers),
-                remote_addr=request.remote_addr,
-                query_params=dict(request.args),
-                metadata=data.get("metadata", {}),
+                return _error_response("JSON body required", 400)
+            metadata = _merge_metadata(
+                data.get("metadata") or {}, _load_schema_metadata_sync()
             )
-            chat_request = ChatRequest(**data)
+            data["metadata"] = metadata
+
+            data["request_context"] = _request_context(metadata)
+            chat_request = ChatRequest.model_validate(data)
             _run_request_guard(chat_request, chat_request.request_context)
         except Exception as e:
-            traceback.print_stack()
-            traceback.print_exc()
-            return jsonify({"error": f"Invalid request: {str(e)}"}), 400
+            logger.warning("Rejected chat_poll_v3 request: %s", e)
+            return _error_response(f"Invalid request: {str(e)}", 400)
 
         try:
-            events = []
+            parts: List[bytes] = []
 
-            async def collect():
+            async def collect() -> None:
+                # Serialize each event as it arrives; only its bytes are kept.
+                first_chunk: Optional[ChatStreamChunk] = None
                 async for chunk in chat_handler.handle_stream(chat_request):
-                    events.append(ChatEvent.from_chunk(chunk).model_dump())
+                    if first_chunk is None:
+                        first_chunk = chunk
+                    parts.append(ChatEvent.json_from_chunk(chunk))
+                if first_chunk is not None:
+                    parts.append(
+                        ChatEvent.done_json(
+                            first_chunk.conversation_id, first_chunk.request_id
+                        )
+                    )
 
             run_async(collect())
-            if events:
-                events.append(
-                    ChatEvent.done(
-                        events[0]["conversation_id"], events[0]["request_id"]
-                    ).model_dump()
-                )
-            return jsonify({"event_version": "v3", "events": events})
+            return Response(poll_response_json(parts), mimetype="application/json")
         except Exception as e:
-            traceback.print_stack()
-            traceback.print_exc()
-            return jsonify({"error": f"Chat failed: {str(e)}"}), 500
+            logger.exception("chat_poll_v3 failed")
+            return _error_response(f"Chat failed: {str(e)}", 500)
 
     @app.route(f"{v3_prefix}/schema/sync", methods=["POST"])
     def schema_sync() -> Union[Response, tuple[Response, int]]:
         """Trigger on-demand schema sync and drift detection."""
         service = config.get("schema_sync_service")
         if service is None:
-            return jsonify({"error": "Schema sync service is not configured."}), 501
-
-        request_context = RequestContext(
-            cookies=dict(request.cookies),
-            headers=dict(request.headers),
-            remote_addr=request.remote_addr,
-            query_params=dict(request.args),
-            metadata={},
-        )
+            return _error_response("Schema sync service is not configured.", 501)
+
+        request_context = _request_context({})
         dummy_request = ChatRequest(message="", request_context=request_context)
         _run_request_guard(dummy_request, request_context)
         tool_context = _build_tool_context(request_context)
 
         try:
             result = run_async(service.sync(tool_context))
-            return jsonify(result.model_dump(mode="json"))
+            schema_metadata.invalidate()
+            return Response(
+                result.__pydantic_serializer__.to_json(result),
+                mimetype="application/json",
+            )
         except Exception as e:
-            traceback.print_stack()
-            traceback.print_exc()
-            return jsonify({"error": f"Schema sync failed: {str(e)}"}), 500
+            logger.exception("schema_sync failed")
+            return _error_response(f"Schema sync failed: {str(e)}", 500)
 
     @app.route(f"{v3_prefix}/schema/status", methods=["GET"])
     def schema_status() -> Union[Response, tuple[Response, int]]:
         """Return latest known schema snapshot metadata."""
         service = config.get("schema_sync_service")
         if service is None:
-            return jsonify({"error": "Schema sync service is not configured."}), 501
+            return _error_response("Schema sync service is not configured.", 501)
 
         try:
             latest = run_async(service.get_latest_snapshot())
             if latest is None:
-                return jsonify({"status": "empty", "snapshot": None})
-            return jsonify({"status": "ok", "snapshot": latest.model_dump(mode="json")})
+                return _json_response({"status": "empty", "snapshot": None})
+            snapshot_json = latest.__pydantic_serializer__.to_json(latest)
+            return Response(
+                b'{"status":"ok","snapshot":' + snapshot_json + b"}",
+                mimetype="application/json",
+            )
         except Exception as e:
-            traceback.print_stack()
-            traceback.print_exc()
-            return jsonify({"error": f"Schema status failed: {str(e)}"}), 500
+            logger.exception("schema_status failed")
+            return _error_response(f"Schema status failed: {str(e)}", 500)
 
     @app.route(f"{v3_prefix}/feedback", methods=["POST"])
     def feedback() -> Union[Response, tuple[Response, int]]:
         """Capture feedback and apply immediate memory patches."""
         feedback_service = config.get("feedback_service")
         if feedback_service is None:
-            return jsonify({"error": "Feedback service is not configured."}), 501
+            return _error_response("Feedback service is not configured.", 501)
 
         try:
-            data = request.get_json()
+            data = _json_body()
             if not data:
-                return jsonify({"error": "JSON body required"}), 400
-            feedback_request = FeedbackRequest(**data)
+                return _error_response("JSON body required", 400)
+            feedback_request = FeedbackRequest.model_validate(data)
         except Exception as e:
-            return jsonify({"error": f"Invalid feedback request: {str(e)}"}), 400
-
-        request_context = RequestContext(
-            cookies=dict(request.cookies),
-            headers=dict(request.headers),
-            remote_addr=request.remote_addr,
-            query_params=dict(request.args),
-            metadata={},
-        )
+            return _error_response(f"Invalid feedback request: {str(e)}", 400)
+
+        request_context = _request_context({})
         dummy_request = ChatRequest(message="", request_context=request_context)
         _run_request_guard(dummy_request, request_context)
 
@@ -314,54 +351,52 @@ def register_chat_routes(
             result = run_async(
                 feedback_service.process_feedback(feedback_request, tool_context)
             )
-            return jsonify(result.model_dump(mode="json"))
+            return Response(
+                result.__pydantic_serializer__.to_json(result),
+                mimetype="application/json",
+            )
         except Exception as e:
-            traceback.print_stack()
-            traceback.print_exc()
-            return jsonify({"error": f"Feedback processing failed: {str(e)}"}), 500
+            logger.exception("feedback failed")
+            return _error_response(f"Feedback processing failed: {str(e)}", 500)
 
     @app.route(f"{v2_prefix}/chat_websocket")
-    def chat_websocket() -> tuple[Response, int]:
+    def chat_websocket() -> Response:
         """WebSocket endpoint placeholder."""
-        return jsonify(
+        return _json_response(
             {
                 "error": "WebSocket endpoint not implemented in basic Flask example",
                 "suggestion": "Use Flask-SocketIO for WebSocket support",
-            }
-        ), 501
+            },
+            501,
+        )
 
     @app.route(f"{v2_prefix}/chat_poll", methods=["POST"])
     def chat_poll() -> Union[Response, tuple[Response, int]]:
         """Polling endpoint for chat."""
         try:
-            data = request.get_json()
+            data = _json_body()
             if not data:
-                return jsonify({"error": "JSON body required"}), 400
-            data["metadata"] = {
-                **data.get("metadata", {}),
-                **_load_schema_metadata_sync(),
-            }
+                return _error_response("JSON body required", 400)
+            metadata = _merge_metadata(
+                data.get("metadata") or {}, _load_schema_metadata_sync()
+            )
+            data["metadata"] = metadata
 
             # Extract request context for user resolution
-            data["request_context"] = RequestContext(
-                cookies=dict(request.cookies),
-                headers=dict(request.headers),
-                remote_addr=request.remote_addr,
-                query_params=dict(request.args),
-                metadata=data.get("metadata", {}),
-            )
+            data["request_context"] = _request_context(metadata)
 
-            chat_request = ChatRequest(**data)
+            chat_request = ChatRequest.model_validate(data)
             _run_request_guard(chat_request, chat_request.request_context)
         except Exception as e:
-            traceback.print_stack()
-            traceback.print_exc()
-            return jsonify({"error": f"Invalid request: {str(e)}"}), 400
+            logger.warning("Rejected chat_poll request: %s", e)
+            return _error_response(f"Invalid request: {str(e)}", 400)
 
         try:
             result = run_async(chat_handler.handle_poll(chat_request))
-            return jsonify(result.model_dump())
+            return Response(
+                result.__pydantic_serializer__.to_json(result),
+                mimetype="application/json",
+            )
         except Exception as e:
-            traceback.print_stack()
-            traceback.print_exc()
-            return jsonify({"error": f"Chat failed: {str(e)}"}), 500
+            logger.exception("chat_poll failed")
+            return _error_response(f"Chat failed: {str(e)}", 500)
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-import uuid
-from datetime import datetime
+import secrets
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
+from vanna.core._compat import utcnow
 from vanna.core.tool import ToolContext
 
 
@@ -43,12 +45,14 @@ class FeedbackService:
     ):
         self.feedback_log_path = Path(feedback_log_path)
         self.review_queue_path = Path(review_queue_path)
+        # Serializes appends from worker threads so lines never interleave.
+        self._lock = threading.Lock()
 
     async def process_feedback(
         self, request: FeedbackRequest, context: ToolContext
     ) -> FeedbackResult:
-        feedback_id = f"fb_{uuid.uuid4().hex[:10]}"
-        now = datetime.utcnow().isoformat()
+        feedback_id = "fb_" + secrets.token_hex(5)
+        now = utcnow().isoformat()
         patched = 0
 
         provenance = {
@@ -68,7 +72,7 @@ class FeedbackService:
                 args={"sql": request.original_sql},
                 context=context,
                 success=False,
-                metadata={"patch_type": "negative", "weight": 2.0, **provenance},
+                metadata={**provenance, "patch_type": "negative", "weight": 2.0},
             )
             patched += 1
 
@@ -80,7 +84,7 @@ class FeedbackService:
                 args={"sql": request.corrected_sql},
                 context=context,
                 success=True,
-                metadata={"patch_type": "corrective", "weight": 5.0, **provenance},
+                metadata={**provenance, "patch_type": "corrective", "weight": 5.0},
             )
             patched += 1
 
@@ -90,17 +94,22 @@ class FeedbackService:
             **request.model_dump(),
             "patched_memories": patched,
         }
-        self._append_jsonl(self.feedback_log_path, payload)
+        records: List[Tuple[Path, Dict[str, Any]]] = [(self.feedback_log_path, payload)]
 
         review_queued = request.enqueue_for_review
         if review_queued:
-            self._append_jsonl(
-                self.review_queue_path,
-                {
-                    **payload,
-                    "review_status": "pending",
-                },
+            records.append(
+                (
+                    self.review_queue_path,
+                    {
+                        **payload,
+                        "review_status": "pending",
+                    },
+                )
             )
+        # Written before returning so accepted feedback is already on disk,
+        # but in a worker thread so the event loop isn't blocked on it.
+        await asyncio.to_thread(self._append_jsonl, records)
 
         return FeedbackResult(
             feedback_id=feedback_id,
@@ -108,7 +117,14 @@ class FeedbackService:
             review_queued=review_queued,
         )
 
-    def _append_jsonl(self, path: Path, payload: Dict[str, Any]) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload, ensure_ascii=True) + "\n")
+    def _append_jsonl(self, records: List[Tuple[Path, Dict[str, Any]]]) -> None:
+        lines: Dict[Path, List[str]] = {}
+        for path, payload in records:
+            lines.setdefault(path, []).append(
+                json.dumps(payload, ensure_ascii=True) + "\n"
+            )
+        with self._lock:
+            for path, path_lines in lines.items():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with path.open("a", encoding="utf-8") as f:
+                    f.writelines(path_lines)
@@ -2,28 +2,55 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
 import hashlib
+import itertools
 import json
+import logging
+import os
 import re
+import stat
+import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 
 import pandas as pd
+from pydantic_core import from_json, to_json
 
 from vanna.capabilities.schema_catalog import (
     SchemaCatalog,
     SchemaColumn,
     SchemaDiff,
     SchemaSnapshot,
+    SchemaSnapshotSummary,
     SchemaSyncResult,
 )
 from vanna.capabilities.sql_runner import RunSqlToolArgs, SqlRunner
+from vanna.core._compat import utcnow
 from vanna.core.tool import ToolContext
 
+logger = logging.getLogger(__name__)
 
 _SQLITE_IDENT = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
+# "sha256" hashes the canonical JSON form and matches previously persisted
+# hashes; "xxh3" (optional xxhash dependency) hashes a compact record form
+# and is much cheaper for wide catalogs.
+_HASH_ALGOS = ("sha256", "xxh3")
+
 
 class PortableSchemaCatalogService(SchemaCatalog):
     """Schema catalog implementation using portable SQL catalog queries."""
@@ -35,18 +62,40 @@ class PortableSchemaCatalogService(SchemaCatalog):
         persist_path: str = ".vanna/schema_catalog_latest.json",
         dialect: str = "unknown",
         cron_schedule: Optional[str] = None,
+        hash_algo: str = "sha256",
     ):
+        if hash_algo not in _HASH_ALGOS:
+            raise ValueError(
+                f"hash_algo must be one of {', '.join(_HASH_ALGOS)}, got {hash_algo!r}"
+            )
+        if hash_algo == "xxh3":
+            try:
+                import xxhash  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "xxhash package is required for hash_algo='xxh3'. "
+                    "Install with: pip install 'vanna[xxhash]'"
+                ) from e
         self.sql_runner = sql_runner
         self.persist_path = Path(persist_path)
         self.dialect = dialect
+        if cron_schedule:
+            # Parse up front so a bad expression fails here, not on a tick.
+            _compile_cron(cron_schedule)
         self.cron_schedule = cron_schedule
-        self._last_scheduled_sync_minute: Optional[str] = None
+        self.hash_algo = hash_algo
+        self._last_scheduled_sync_minute: Optional[int] = None
+        self._background_task: Optional["asyncio.Task[None]"] = None
+        # Last snapshot read or written, keyed by the file version it matches.
+        self._cached_snapshot: Optional[Tuple[Tuple[int, int, int], SchemaSnapshot]] = (
+            None
+        )
 
     async def capture_snapshot(self, context: ToolContext) -> SchemaSnapshot:
         columns = await self._fetch_columns(context)
         schema_hash = self._compute_hash(columns)
         return SchemaSnapshot(
-            snapshot_id=f"snap_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}",
+            snapshot_id=f"snap_{utcnow().strftime('%Y%m%d%H%M%S')}",
             dialect=self.dialect,
             schema_hash=schema_hash,
             columns=columns,
@@ -55,6 +104,21 @@ class PortableSchemaCatalogService(SchemaCatalog):
     async def sync(self, context: ToolContext) -> SchemaSyncResult:
         previous = await self.get_latest_snapshot()
         current = await self.capture_snapshot(context)
+        if (
+            previous is not None
+            and previous.schema_hash == current.schema_hash
+            and previous.dialect == current.dialect
+        ):
+            # Unchanged schema: keep the snapshot on record rather than
+            # rewriting the same content under a new id.
+            return SchemaSyncResult(
+                snapshot=previous,
+                diff=SchemaDiff(
+                    previous_schema_hash=previous.schema_hash,
+                    current_schema_hash=current.schema_hash,
+                ),
+            )
+
         diff = self._diff_snapshots(previous, current)
         self._persist_snapshot(current)
 
@@ -66,26 +130,99 @@ class PortableSchemaCatalogService(SchemaCatalog):
     async def run_scheduled_sync_if_due(
         self, context: ToolContext, now: Optional[datetime] = None
     ) -> Optional[SchemaSyncResult]:
-        """Cron-compatible scheduler hook (5-field cron expression)."""
+        """Cron-compatible scheduler hook (5-field cron expression).
+
+        Callers that poll this themselves should prefer ``start_background``,
+        which evaluates the schedule once per minute off the request path.
+        """
         if not self.cron_schedule:
             return None
 
-        now = now or datetime.utcnow()
-        if not _cron_matches(self.cron_schedule, now):
+        now = now or utcnow()
+        # Minutes since 0001-01-01 of the wall-clock time; unlike timestamp(),
+        # this never consults the local timezone.
+        minute_key = now.toordinal() * 1440 + now.hour * 60 + now.minute
+        if self._last_scheduled_sync_minute == minute_key:
             return None
 
-        minute_key = now.strftime("%Y-%m-%d %H:%M")
-        if self._last_scheduled_sync_minute == minute_key:
+        if not _cron_fields_match(_compile_cron(self.cron_schedule), now):
             return None
 
         self._last_scheduled_sync_minute = minute_key
         return await self.sync(context)
 
+    def start_background(self, context_factory: Callable[[], ToolContext]) -> None:
+        """Run the cron schedule from a task on the current event loop.
+
+        The task wakes at each minute boundary and syncs with a context from
+        ``context_factory`` when the schedule matches. Does nothing without a
+        ``cron_schedule`` or when the task is already running.
+        """
+        if not self.cron_schedule:
+            return
+        if self._background_task is not None and not self._background_task.done():
+            return
+        self._background_task = asyncio.ensure_future(
+            self._run_background(context_factory)
+        )
+
+    async def stop_background(self) -> None:
+        """Cancel the background schedule task and wait for it to finish."""
+        task, self._background_task = self._background_task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def _run_background(self, context_factory: Callable[[], ToolContext]) -> None:
+        while True:
+            await asyncio.sleep(_seconds_until_next_minute())
+            try:
+                await self.run_scheduled_sync_if_due(context_factory())
+            except Exception:
+                logger.exception("Scheduled schema sync failed")
+
     async def get_latest_snapshot(self) -> Optional[SchemaSnapshot]:
-        if not self.persist_path.exists():
+        file_key = self._persisted_file_key()
+        if file_key is None:
+            return None
+        cached = self._cached_snapshot
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+        payload = from_json(self.persist_path.read_bytes())
+        snapshot = SchemaSnapshot.model_validate(payload["snapshot"])
+        self._cached_snapshot = (file_key, snapshot)
+        return snapshot
+
+    async def get_latest_snapshot_summary(self) -> Optional[SchemaSnapshotSummary]:
+        file_key = self._persisted_file_key()
+        if file_key is None:
+            return None
+        cached = self._cached_snapshot
+        if cached is not None and cached[0] == file_key:
+            return SchemaSnapshotSummary.from_snapshot(cached[1])
+        payload = from_json(self.persist_path.read_bytes())
+        # Validate only the identity fields; the column list is never built.
+        return SchemaSnapshotSummary.model_validate(
+            {
+                key: value
+                for key, value in payload["snapshot"].items()
+                if key != "columns"
+            }
+        )
+
+    def _persisted_file_key(self) -> Optional[Tuple[int, int, int]]:
+        """Identify the current snapshot file version, or None if it's absent.
+
+        Snapshots are replaced atomically, so a rewrite always changes the
+        inode as well as the mtime/size.
+        """
+        try:
+            st = self.persist_path.stat()
+        except FileNotFoundError:
             return None
-        payload = json.loads(self.persist_path.read_text(encoding="utf-8"))
-        return SchemaSnapshot.model_validate(payload["snapshot"])
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
 
     async def _fetch_columns(self, context: ToolContext) -> List[SchemaColumn]:
         # Portable baseline query for most warehouse/OLTP engines.
@@ -127,71 +264,101 @@ class PortableSchemaCatalogService(SchemaCatalog):
             context,
         )
 
-        columns: List[SchemaColumn] = []
-        for table_name in tables_df["name"].tolist():
+        table_names = _column_values(tables_df, "name")
+        for table_name in table_names:
             if not _SQLITE_IDENT.match(table_name):
                 raise ValueError(f"Refusing unsafe table identifier: {table_name!r}")
-            pragma_df = await self.sql_runner.run_sql(
-                RunSqlToolArgs(sql=f'PRAGMA table_info("{table_name}")'),
-                context,
+
+        # Run one after another: SQLite runners execute synchronously, so
+        # overlapping the calls would not make them faster.
+        pragma_dfs = [
+            await self.sql_runner.run_sql(
+                RunSqlToolArgs(sql=f'PRAGMA table_info("{table_name}")'), context
             )
-            for _, row in pragma_df.iterrows():
-                columns.append(
-                    SchemaColumn(
-                        schema_name="main",
-                        table_name=table_name,
-                        column_name=str(row["name"]),
-                        data_type=str(row["type"]),
-                        is_nullable=bool(int(row.get("notnull", 0)) == 0),
-                    )
+            for table_name in table_names
+        ]
+
+        columns: List[SchemaColumn] = []
+        for table_name, pragma_df in zip(table_names, pragma_dfs):
+            columns.extend(
+                SchemaColumn.model_construct(
+                    schema_name="main",
+                    table_name=table_name,
+                    column_name=str(name),
+                    data_type=str(data_type),
+                    is_nullable=int(notnull) == 0,
+                )
+                for name, data_type, notnull in zip(
+                    _column_values(pragma_df, "name"),
+                    _column_values(pragma_df, "type"),
+                    _column_values(pragma_df, "notnull", 0),
                 )
+            )
 
         return columns
 
     def _columns_from_dataframe(self, df: pd.DataFrame) -> List[SchemaColumn]:
-        columns: List[SchemaColumn] = []
-        for _, row in df.iterrows():
-            columns.append(
-                SchemaColumn(
-                    schema_name=str(row.get("schema_name"))
-                    if row.get("schema_name") is not None
-                    else None,
-                    table_name=str(row.get("table_name")),
-                    column_name=str(row.get("column_name")),
-                    data_type=str(row.get("data_type")),
-                    is_nullable=bool(int(row.get("is_nullable", 0))),
-                )
+        # Pull each column out once instead of boxing every row into a Series.
+        # Values are coerced here, so the models are built without validation.
+        return [
+            SchemaColumn.model_construct(
+                schema_name=str(schema_name) if schema_name is not None else None,
+                table_name=str(table_name),
+                column_name=str(column_name),
+                data_type=str(data_type),
+                is_nullable=bool(int(is_nullable)),
             )
-        return columns
+            for schema_name, table_name, column_name, data_type, is_nullable in zip(
+                _column_values(df, "schema_name"),
+                _column_values(df, "table_name"),
+                _column_values(df, "column_name"),
+                _column_values(df, "data_type"),
+                _column_values(df, "is_nullable", 0),
+            )
+        ]
 
     def _compute_hash(self, columns: List[SchemaColumn]) -> str:
-        normalized = sorted(
-            [
-                {
-                    "schema_name": c.schema_name or "",
-                    "table_name": c.table_name,
-                    "column_name": c.column_name,
-                    "data_type": c.data_type,
-                    "is_nullable": c.is_nullable,
-                }
-                for c in columns
-            ],
+        if self.hash_algo == "xxh3":
+            return _xxh3_hash(columns)
+
+        # Feed the canonical JSON array to the digest one record at a time;
+        # the bytes match json.dumps of the whole sorted list, so hashes stay
+        # comparable with persisted snapshots.
+        ordered = sorted(
+            columns,
             key=lambda c: (
-                c["schema_name"],
-                c["table_name"],
-                c["column_name"],
-                c["data_type"],
+                c.schema_name or "",
+                c.table_name,
+                c.column_name,
+                c.data_type,
             ),
         )
-        content = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        digest = hashlib.sha256(b"[")
+        for i, c in enumerate(ordered):
+            if i:
+                digest.update(b",")
+            record = {
+                "schema_name": c.schema_name or "",
+                "table_name": c.table_name,
+                "column_name": c.column_name,
+                "data_type": c.data_type,
+                "is_nullable": c.is_nullable,
+            }
+            digest.update(
+                json.dumps(record, sort_keys=True, separators=(",", ":")).encode()
+            )
+        digest.update(b"]")
+        return digest.hexdigest()
 
     def _persist_snapshot(self, snapshot: SchemaSnapshot) -> None:
         self.persist_path.parent.mkdir(parents=True, exist_ok=True)
-        self.persist_path.write_text(
-            json.dumps({"snapshot": snapshot.model_dump(mode="json")}, indent=2),
-            encoding="utf-8",
+        # Serialize straight from the model, without a model_dump() dict tree.
+        _atomic_write_bytes(
+            self.persist_path, to_json({"snapshot": snapshot}, indent=2)
         )
+        file_key = self._persisted_file_key()
+        if file_key is not None:
+            self._cached_snapshot = (file_key, snapshot)
 
     def _column_key(self, column: SchemaColumn) -> Tuple[str, str, str]:
         return (column.schema_name or "", column.table_name, column.column_name)
@@ -207,20 +374,27 @@ class PortableSchemaCatalogService(SchemaCatalog):
         current_index = self._to_index(current.columns)
         previous_index = self._to_index(previous.columns if previous else [])
 
-        added = [c for k, c in current_index.items() if k not in previous_index]
-        removed = [c for k, c in previous_index.items() if k not in current_index]
-
+        # One pass over the current columns classifies added and changed ones,
+        # keeping snapshot order.
+        added: List[SchemaColumn] = []
         changed: List[SchemaColumn] = []
         for key, current_col in current_index.items():
             old_col = previous_index.get(key)
             if old_col is None:
-                continue
-            if (
+                added.append(current_col)
+            elif (
                 old_col.data_type != current_col.data_type
                 or old_col.is_nullable != current_col.is_nullable
             ):
                 changed.append(current_col)
 
+        # Every previous column not matched above was removed; skip the scan
+        # when the counts show there are none.
+        matched = len(current_index) - len(added)
+        removed: List[SchemaColumn] = []
+        if len(previous_index) > matched:
+            removed = [c for k, c in previous_index.items() if k not in current_index]
+
         return SchemaDiff(
             previous_schema_hash=previous.schema_hash if previous else None,
             current_schema_hash=current.schema_hash,
@@ -237,37 +411,126 @@ class PortableSchemaCatalogService(SchemaCatalog):
             f"Removed: {len(diff.removed_columns)}, Changed: {len(diff.changed_columns)}. "
             f"Current schema hash: {diff.current_schema_hash}."
         )
-        await context.agent_memory.save_text_memory(summary, context)
-
-        for column in (diff.added_columns + diff.changed_columns)[:25]:
-            await context.agent_memory.save_text_memory(
-                (
-                    f"Schema entity updated: "
-                    f"{column.schema_name or 'default'}.{column.table_name}.{column.column_name} "
-                    f"type={column.data_type} nullable={column.is_nullable}"
-                ),
-                context,
+        entity_notes = [
+            (
+                f"Schema entity updated: "
+                f"{column.schema_name or 'default'}.{column.table_name}.{column.column_name} "
+                f"type={column.data_type} nullable={column.is_nullable}"
             )
+            for column in itertools.islice(
+                itertools.chain(diff.added_columns, diff.changed_columns), 25
+            )
+        ]
+        # Independent writes; issue them together rather than one at a time.
+        await asyncio.gather(
+            *(
+                context.agent_memory.save_text_memory(note, context)
+                for note in [summary, *entity_notes]
+            )
+        )
 
 
-def _cron_matches(expr: str, dt: datetime) -> bool:
-    """Very small cron matcher for 5-field cron expressions."""
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so readers see the old or new file whole."""
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file 0600; give it the mode a plain write
+        # would have, so other readers of the catalog keep access.
+        os.chmod(tmp_name, _replacement_mode(path))
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
+def _replacement_mode(path: Path) -> int:
+    """Return the existing file's permissions, or the umask default if new."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _column_values(df: pd.DataFrame, name: str, default: Any = None) -> List[Any]:
+    """Return a DataFrame column as a list, or ``default`` per row if absent."""
+    if name in df.columns:
+        return df[name].tolist()
+    return [default] * len(df)
+
+
+def _xxh3_hash(columns: Iterable[SchemaColumn]) -> str:
+    """Hash columns as sorted unit-separated records, without building JSON."""
+    import xxhash
+
+    records = sorted(
+        (
+            c.schema_name or "",
+            c.table_name,
+            c.column_name,
+            c.data_type,
+            "" if c.is_nullable is None else "1" if c.is_nullable else "0",
+        )
+        for c in columns
+    )
+    h = xxhash.xxh3_64()
+    for record in records:
+        h.update("\x1f".join(record).encode("utf-8"))
+        h.update(b"\x1e")
+    return h.hexdigest()
+
+
+# Values each cron field can take: minute, hour, day of month, month and
+# day of week (0 = Sunday).
+_CRON_FIELD_VALUES = (range(60), range(24), range(1, 32), range(1, 13), range(7))
+
+CronFields = Tuple[
+    FrozenSet[int], FrozenSet[int], FrozenSet[int], FrozenSet[int], FrozenSet[int]
+]
+
+
+def _seconds_until_next_minute() -> float:
+    return 60 - time.time() % 60
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_cron(expr: str) -> CronFields:
+    """Expand a 5-field cron expression into the set of matching values per field."""
     parts = expr.strip().split()
     if len(parts) != 5:
         raise ValueError("cron_schedule must use 5 fields: m h dom mon dow")
 
-    minute, hour, day_of_month, month, day_of_week = parts
-    return all(
-        [
-            _field_matches(minute, dt.minute),
-            _field_matches(hour, dt.hour),
-            _field_matches(day_of_month, dt.day),
-            _field_matches(month, dt.month),
-            _field_matches(day_of_week, (dt.weekday() + 1) % 7),
-        ]
+    minute, hour, day_of_month, month, day_of_week = (
+        frozenset(value for value in values if _field_matches(field, value))
+        for field, values in zip(parts, _CRON_FIELD_VALUES)
+    )
+    return minute, hour, day_of_month, month, day_of_week
+
+
+def _cron_fields_match(fields: CronFields, dt: datetime) -> bool:
+    minute, hour, day_of_month, month, day_of_week = fields
+    return (
+        dt.minute in minute
+        and dt.hour in hour
+        and dt.day in day_of_month
+        and dt.month in month
+        and (dt.weekday() + 1) % 7 in day_of_week
     )
 
 
+def _cron_matches(expr: str, dt: datetime) -> bool:
+    """Very small cron matcher for 5-field cron expressions."""
+    return _cron_fields_match(_compile_cron(expr), dt)
+
+
 def _field_matches(field: str, value: int) -> bool:
     if field == "*":
         return True
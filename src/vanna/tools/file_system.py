@@ -10,7 +10,7 @@ import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, List, Optional, Type
+from typing import Any, Dict, Iterable, List, Optional, Type
 import difflib
 import hashlib
 
@@ -79,6 +79,14 @@ class FileSystem(ABC):
         """Read the contents of a file."""
         pass
 
+    async def read_file_bytes(self, filename: str, context: ToolContext) -> bytes:
+        """Read the raw (UTF-8 encoded) contents of a file.
+
+        The default encodes ``read_file``; implementations backed by real
+        files can return the bytes without decoding them first.
+        """
+        return (await self.read_file(filename, context)).encode("utf-8")
+
     @abstractmethod
     async def write_file(
         self, filename: str, content: str, context: ToolContext, overwrite: bool = False
@@ -86,6 +94,22 @@ class FileSystem(ABC):
         """Write content to a file."""
         pass
 
+    async def write_file_chunks(
+        self,
+        filename: str,
+        chunks: Iterable[str],
+        context: ToolContext,
+        overwrite: bool = False,
+    ) -> None:
+        """Write content produced in pieces to a file.
+
+        The default joins the chunks in a worker thread, since producing them
+        may be CPU-bound, and calls ``write_file``; implementations backed by
+        real files can stream them instead.
+        """
+        content = await asyncio.to_thread("".join, chunks)
+        await self.write_file(filename, content, context, overwrite=overwrite)
+
     @abstractmethod
     async def exists(self, path: str, context: ToolContext) -> bool:
         """Check if a file or directory exists."""
@@ -130,6 +154,9 @@ class LocalFileSystem(FileSystem):
             working_directory: Base directory where user-specific folders will be created
         """
         self.working_directory = Path(working_directory)
+        # Created user directories by user ID, so repeat calls skip the hash
+        # and the mkdir syscall.
+        self._user_dirs: Dict[str, Path] = {}
 
     def _get_user_directory(self, context: ToolContext) -> Path:
         """Get the user-specific directory by hashing the user ID.
@@ -140,6 +167,10 @@ class LocalFileSystem(FileSystem):
         Returns:
             Path to the user-specific directory
         """
+        user_dir = self._user_dirs.get(context.user.id)
+        if user_dir is not None:
+            return user_dir
+
         # Hash the user ID to create a directory name
         user_hash = hashlib.sha256(context.user.id.encode()).hexdigest()[:16]
         user_dir = self.working_directory / user_hash
@@ -147,6 +178,7 @@ class LocalFileSystem(FileSystem):
         # Create the directory if it doesn't exist
         user_dir.mkdir(parents=True, exist_ok=True)
 
+        self._user_dirs[context.user.id] = user_dir
         return user_dir
 
     def _resolve_path(self, path: str, context: ToolContext) -> Path:
@@ -201,6 +233,18 @@ class LocalFileSystem(FileSystem):
 
         return file_path.read_text(encoding="utf-8")
 
+    async def read_file_bytes(self, filename: str, context: ToolContext) -> bytes:
+        """Read the raw contents of a file within the user's isolated space."""
+        file_path = self._resolve_path(filename, context)
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"File '{filename}' does not exist")
+
+        if not file_path.is_file():
+            raise IsADirectoryError(f"'{filename}' is a directory, not a file")
+
+        return file_path.read_bytes()
+
     async def write_file(
         self, filename: str, content: str, context: ToolContext, overwrite: bool = False
     ) -> None:
@@ -217,6 +261,35 @@ class LocalFileSystem(FileSystem):
 
         file_path.write_text(content, encoding="utf-8")
 
+    async def write_file_chunks(
+        self,
+        filename: str,
+        chunks: Iterable[str],
+        context: ToolContext,
+        overwrite: bool = False,
+    ) -> None:
+        """Stream chunks to a file within the user's isolated space.
+
+        Producing and writing the chunks both happen in a worker thread, so
+        neither blocks the event loop.
+        """
+        file_path = self._resolve_path(filename, context)
+
+        def write() -> None:
+            # Create parent directories if they don't exist
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+
+            if file_path.exists() and not overwrite:
+                raise FileExistsError(
+                    f"File '{filename}' already exists. "
+                    "Use overwrite=True to replace it."
+                )
+
+            with open(file_path, "w", encoding="utf-8") as fh:
+                fh.writelines(chunks)
+
+        await asyncio.to_thread(write)
+
     async def exists(self, path: str, context: ToolContext) -> bool:
         """Check if a file or directory exists within the user's isolated space."""
         try:
@@ -287,8 +360,11 @@ class LocalFileSystem(FileSystem):
                     continue
 
             if include_content and content is not None:
-                if query_lower in content.lower():
-                    snippet = _make_snippet(content, trimmed_query) or snippet
+                # One lowercase pass: _make_snippet finds the match or
+                # returns None.
+                content_snippet = _make_snippet(content, trimmed_query)
+                if content_snippet is not None:
+                    snippet = content_snippet
                     include_entry = True
                 elif not include_entry:
                     continue
@@ -1,7 +1,20 @@
 """Generic SQL query execution tool with dependency injection."""
 
-from typing import Any, Dict, List, Optional, Type, cast, Set
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+    Set,
+)
+import asyncio
 import uuid
+import pandas as pd
 import sqlglot
 from sqlglot import expressions as exp
 from vanna.core.tool import Tool, ToolContext, ToolResult
@@ -62,15 +75,18 @@ class RunSqlTool(Tool[RunSqlToolArgs]):
         self._custom_name = custom_tool_name
         self._custom_description = custom_tool_description
         self.read_only = read_only
-        self.allowed_statement_types = allowed_statement_types or {
-            "SELECT",
-            "WITH",
-            "SHOW",
-            "DESCRIBE",
-            "DESC",
-            "EXPLAIN",
-            "PRAGMA",
-        }
+        self.allowed_statement_types: FrozenSet[str] = frozenset(
+            allowed_statement_types
+            or {
+                "SELECT",
+                "WITH",
+                "SHOW",
+                "DESCRIBE",
+                "DESC",
+                "EXPLAIN",
+                "PRAGMA",
+            }
+        )
 
     @property
     def name(self) -> str:
@@ -93,17 +109,8 @@ class RunSqlTool(Tool[RunSqlToolArgs]):
             if self.read_only:
                 validation_error = self._validate_read_only_sql(args.sql)
                 if validation_error:
-                    return ToolResult(
-                        success=False,
-                        result_for_llm=validation_error,
-                        ui_component=UiComponent(
-                            rich_component=NotificationComponent(
-                                type=ComponentType.NOTIFICATION,
-                                level="error",
-                                message=validation_error,
-                            ),
-                            simple_component=SimpleTextComponent(text=validation_error),
-                        ),
+                    return self._error_result(
+                        validation_error,
                         error=validation_error,
                         metadata={
                             "error_type": "sql_security_violation",
@@ -162,18 +169,23 @@ class RunSqlTool(Tool[RunSqlToolArgs]):
                     "results": [],
                 }
             else:
-                results_data = df.to_dict("records")
+                # Row-wise conversion, the preview and component validation
+                # are CPU-bound; run them on a worker thread so the event
+                # loop keeps serving other requests.
+                (
+                    results_data,
+                    results_preview,
+                    dataframe_component,
+                ) = await asyncio.to_thread(self._serialize_results, df)
                 columns = df.columns.tolist()
                 row_count = len(df)
 
                 file_id = str(uuid.uuid4())[:8]
                 filename = f"query_results_{file_id}.csv"
-                csv_content = df.to_csv(index=False)
-                await self.file_system.write_file(
-                    filename, csv_content, context, overwrite=True
+                await self.file_system.write_file_chunks(
+                    filename, self._iter_csv_chunks(df), context, overwrite=True
                 )
 
-                results_preview = csv_content
                 if len(results_preview) > 1000:
                     results_preview = (
                         results_preview[:1000]
@@ -181,11 +193,6 @@ class RunSqlTool(Tool[RunSqlToolArgs]):
                     )
                 result = f"{results_preview}\n\nResults saved to file: {filename}\n\n**IMPORTANT: FOR VISUALIZE_DATA USE FILENAME: {filename}**"
 
-                dataframe_component = DataFrameComponent.from_records(
-                    records=cast(List[Dict[str, Any]], results_data),
-                    title="Query Results",
-                    description=f"SQL query returned {row_count} rows with {len(columns)} columns",
-                )
                 ui_component = UiComponent(
                     rich_component=dataframe_component,
                     simple_component=SimpleTextComponent(text=result),
@@ -208,33 +215,99 @@ class RunSqlTool(Tool[RunSqlToolArgs]):
             )
 
         except Exception as e:
-            error_message = f"Error executing query: {str(e)}"
-            return ToolResult(
-                success=False,
-                result_for_llm=error_message,
-                ui_component=UiComponent(
-                    rich_component=NotificationComponent(
-                        type=ComponentType.NOTIFICATION,
-                        level="error",
-                        message=error_message,
-                    ),
-                    simple_component=SimpleTextComponent(text=error_message),
-                ),
+            return self._error_result(
+                f"Error executing query: {str(e)}",
                 error=str(e),
                 metadata={"error_type": "sql_error", "executed_sql": args.sql},
             )
 
+    @staticmethod
+    def _error_result(
+        message: str, *, error: str, metadata: Dict[str, Any]
+    ) -> ToolResult:
+        """Build a failed ToolResult that shows ``message`` as an error.
+
+        A fresh result is built per call: the registry adds timing to
+        ``metadata`` and components carry their own ids, so none of it can be
+        shared between calls.
+        """
+        return ToolResult(
+            success=False,
+            result_for_llm=message,
+            ui_component=UiComponent(
+                rich_component=NotificationComponent(
+                    type=ComponentType.NOTIFICATION,
+                    level="error",
+                    message=message,
+                ),
+                simple_component=SimpleTextComponent(text=message),
+            ),
+            error=error,
+            metadata=metadata,
+        )
+
+    @classmethod
+    def _serialize_results(
+        cls, df: pd.DataFrame
+    ) -> Tuple[List[Dict[str, Any]], str, DataFrameComponent]:
+        """Convert a result DataFrame into records, a CSV preview and a UI table."""
+        component = DataFrameComponent.from_dataframe(
+            df,
+            title="Query Results",
+            description=f"SQL query returned {len(df)} rows with {len(df.columns)} columns",
+        )
+        # Metadata gets its own list of the component's row dicts, so the
+        # rows are built once but neither list changes with the other.
+        return list(component.rows), cls._csv_preview(df, 1000), component
+
+    @staticmethod
+    def _iter_csv_chunks(
+        df: pd.DataFrame, rows_per_chunk: int = 10_000
+    ) -> Iterator[str]:
+        """Yield ``df.to_csv(index=False)`` in pieces of ``rows_per_chunk`` rows."""
+        for start in range(0, len(df), rows_per_chunk):
+            yield df.iloc[start : start + rows_per_chunk].to_csv(
+                index=False, header=start == 0
+            )
+
+    @staticmethod
+    def _csv_preview(df: pd.DataFrame, limit: int) -> str:
+        """Return a CSV prefix of ``df`` that is longer than ``limit`` characters.
+
+        Only as many leading rows are serialized as the preview needs; the
+        result equals the start of ``df.to_csv(index=False)`` (or all of it
+        when the full CSV is shorter than ``limit``).
+        """
+        n = min(len(df), 50)
+        while True:
+            text = df.head(n).to_csv(index=False)
+            if len(text) > limit or n >= len(df):
+                return text
+            n = min(len(df), n * 4)
+
     def _validate_read_only_sql(self, sql: str) -> Optional[str]:
         """Validate SQL against the read-only policy using AST parsing.
 
-        Defense in depth: parse the statement, reject multiple statements,
-        reject anything that mutates data/schema anywhere in the tree
-        (covers data-modifying CTEs), and require the top-level keyword to be
-        in the read-only allowlist. Fails closed on parse errors.
+        Defense in depth: require the top-level keyword to be in the read-only
+        allowlist, parse the statement, reject multiple statements, and reject
+        anything that mutates data/schema anywhere in the tree (covers
+        data-modifying CTEs). Fails closed on parse errors.
         """
         if not sql or not sql.strip():
             return "SQL query cannot be empty."
 
+        # The keyword allowlist needs no parse, so check it first: statements
+        # it rejects never reach the (much slower) sqlglot parser. They all get
+        # the allowlist message, even when a parse would have found a write or
+        # a second statement (see test_rejection_messages).
+        first_keyword = sql.strip().split(None, 1)[0].upper()
+        if first_keyword not in self.allowed_statement_types:
+            allowed_list = ", ".join(sorted(self.allowed_statement_types))
+            return (
+                f"Blocked by read-only SQL policy. "
+                f"Allowed statement types: {allowed_list}."
+            )
+
         try:
             statements = [
                 s for s in sqlglot.parse(sql) if isinstance(s, exp.Expression)
@@ -260,14 +333,6 @@ class RunSqlTool(Tool[RunSqlToolArgs]):
         command_block = self._validate_command_payload(statement)
         if command_block is not None:
             return command_block
-
-        first_keyword = sql.strip().split(None, 1)[0].upper()
-        if first_keyword not in self.allowed_statement_types:
-            allowed_list = ", ".join(sorted(self.allowed_statement_types))
-            return (
-                f"Blocked by read-only SQL policy. "
-                f"Allowed statement types: {allowed_list}."
-            )
         return None
 
     def _validate_command_payload(self, statement: exp.Expression) -> Optional[str]:
@@ -71,6 +71,11 @@ class SemanticQueryTool(Tool[SemanticQueryToolArgs]):
             ),
             metadata={
                 "semantic_query": request.model_dump(),
-                "semantic_result": result.model_dump(),
+                # Rows are plain dicts already; reference them rather than
+                # deep-copying every row through model_dump.
+                "semantic_result": {
+                    **result.model_dump(exclude={"rows"}),
+                    "rows": result.rows,
+                },
             },
         )
@@ -1,6 +1,9 @@
 """Tool for visualizing DataFrame data from CSV files."""
 
-from typing import Any, Optional, Type, cast
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional, Type, cast
+import hashlib
+import io
 import logging
 import pandas as pd
 from pydantic import BaseModel, Field
@@ -20,6 +23,36 @@ from vanna.integrations.plotly import PlotlyChartGenerator
 
 logger = logging.getLogger(__name__)
 
+# Rows of a CSV embedded in a chart spec; only these need to be parsed
+# into Python objects for vega-lite charts.
+PREVIEW_ROWS = 500
+
+# How many parsed CSV previews each tool keeps for repeat visualizations.
+_PARSED_CSV_CACHE_SIZE = 8
+
+
+class _ParsedCsv(NamedTuple):
+    df: Optional[pd.DataFrame]  # whole file; parsed per plotly chart, never cached
+    records: "list[dict[str, Any]]"
+    columns: "list[Any]"
+    column_types: dict[str, str]
+    row_count: int
+
+
+def _column_type(kinds: "set[str]") -> str:
+    """Map the dtype kind codes a column was parsed with to a Vega-Lite type.
+
+    The codes agree with pandas' ``is_datetime64_any_dtype`` ("M") and
+    ``is_numeric_dtype`` ("iufcb"). A column read in chunks is numeric only if
+    every chunk was (mixing bools with numbers parses as object), matching
+    what a single whole-file parse would infer.
+    """
+    if kinds == {"M"}:
+        return "temporal"
+    if kinds == {"b"} or kinds <= set("iufc"):
+        return "quantitative"
+    return "nominal"
+
 
 class VisualizeDataArgs(BaseModel):
     """Arguments for visualize_data tool."""
@@ -50,6 +83,10 @@ class VisualizeDataTool(Tool[VisualizeDataArgs]):
         """
         self.file_system = file_system or LocalFileSystem()
         self.plotly_generator = plotly_generator or PlotlyChartGenerator()
+        # Parsed CSVs keyed by a digest of their bytes, least recently used
+        # first: re-charting an unchanged file skips parsing and type
+        # inference.
+        self._parsed_csvs: "OrderedDict[bytes, _ParsedCsv]" = OrderedDict()
 
     @property
     def name(self) -> str:
@@ -70,25 +107,23 @@ class VisualizeDataTool(Tool[VisualizeDataArgs]):
             logger.info(f"Starting visualization for file: {args.filename}")
 
             # Read the CSV file using FileSystem
-            csv_content = await self.file_system.read_file(args.filename, context)
-            logger.info(f"Read {len(csv_content)} bytes from CSV file")
+            # Raw bytes go straight to the parser, which decodes as it reads.
+            raw = await self.file_system.read_file_bytes(args.filename, context)
+            logger.info(f"Read {len(raw)} bytes from CSV file")
 
-            # Parse CSV into DataFrame
-            import io
-
-            df = pd.read_csv(io.StringIO(csv_content))
-            logger.info(
-                f"Parsed DataFrame with shape {df.shape}, columns: {df.columns.tolist()}, dtypes: {df.dtypes.to_dict()}"
-            )
+            # Parse CSV; plotly charts are built from the whole frame, vega-lite
+            # specs only need the preview rows plus counts and types.
+            parsed = self._parse_csv(raw, full_frame=args.format == "plotly-json")
+            records = parsed.records
 
             # Generate title
             title = args.title or f"Visualization of {args.filename}"
 
             # Build declarative chart spec (safe-by-default).
-            records = cast("list[dict[str, Any]]", df.head(500).to_dict("records"))
-            column_types = self._infer_column_types(df)
             if args.format == "plotly-json":
-                chart_dict = self.plotly_generator.generate_chart(df, title)
+                chart_dict = self.plotly_generator.generate_chart(
+                    cast(pd.DataFrame, parsed.df), title
+                )
                 chart_spec = ChartSpec(
                     format="plotly-json",
                     schema_version="v1",
@@ -99,25 +134,28 @@ class VisualizeDataTool(Tool[VisualizeDataArgs]):
             else:
                 chart_spec = dataframe_to_vega_lite_spec(
                     rows=records,
-                    columns=df.columns.tolist(),
-                    column_types=column_types,
+                    columns=parsed.columns,
+                    column_types=parsed.column_types,
                     title=title,
                 )
                 chart_spec.metadata["source_file"] = args.filename
 
             # Create result message
-            row_count = len(df)
-            col_count = len(df.columns)
+            row_count = parsed.row_count
+            col_count = len(parsed.columns)
             result = (
                 f"Created declarative chart spec from '{args.filename}' "
                 f"({row_count} rows, {col_count} columns)."
             )
 
+            # Dump the spec once; the component and metadata share it.
+            spec_dict = chart_spec.model_dump()
+
             # Create ChartComponent
             logger.info("Creating ChartComponent...")
             chart_component = ChartComponent(
                 chart_type="declarative",
-                data=chart_spec.model_dump(),
+                data=spec_dict,
                 title=title,
                 config={
                     "data_shape": {"rows": row_count, "columns": col_count},
@@ -139,7 +177,13 @@ class VisualizeDataTool(Tool[VisualizeDataArgs]):
                     "filename": args.filename,
                     "rows": row_count,
                     "columns": col_count,
-                    "chart_spec": chart_spec.model_dump(),
+                    # The embedded rows travel with the UI component; metadata
+                    # keeps the spec without a second copy of the dataset.
+                    "chart_spec": {
+                        key: value
+                        for key, value in spec_dict.items()
+                        if key != "dataset"
+                    },
                 },
             )
             logger.info("ToolResult created successfully")
@@ -217,15 +261,80 @@ class VisualizeDataTool(Tool[VisualizeDataArgs]):
                 metadata={"error_type": "general_error"},
             )
 
+    def _parse_csv(self, raw: bytes, full_frame: bool) -> _ParsedCsv:
+        """Parse CSV bytes, reusing the preview for content seen recently.
+
+        With ``full_frame`` the whole file is loaded into a DataFrame;
+        otherwise only the first ``PREVIEW_ROWS`` rows are kept and the rest
+        of the file is scanned for its row count and column types. Only the
+        preview, counts and types are cached, so the cache stays small no
+        matter how large the files are.
+        """
+        key = hashlib.blake2b(raw, digest_size=16).digest()
+        parsed = self._parsed_csvs.get(key)
+        if parsed is not None and not full_frame:
+            self._parsed_csvs.move_to_end(key)
+            return parsed
+
+        parsed = self._read_frame(raw) if full_frame else self._read_preview(raw)
+        self._parsed_csvs[key] = parsed._replace(df=None)
+        self._parsed_csvs.move_to_end(key)
+        if len(self._parsed_csvs) > _PARSED_CSV_CACHE_SIZE:
+            self._parsed_csvs.popitem(last=False)
+        return parsed
+
+    def _read_frame(self, raw: bytes) -> _ParsedCsv:
+        """Load the whole CSV into a DataFrame."""
+        df = pd.read_csv(io.BytesIO(raw))
+        # Listing columns and dtypes walks every column; only pay for it
+        # when INFO logging is actually on.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Parsed DataFrame with shape {df.shape}, columns: {df.columns.tolist()}, dtypes: {df.dtypes.to_dict()}"
+            )
+
+        return _ParsedCsv(
+            df=df,
+            records=cast(
+                "list[dict[str, Any]]", df.head(PREVIEW_ROWS).to_dict("records")
+            ),
+            columns=df.columns.tolist(),
+            column_types=self._infer_column_types(df),
+            row_count=len(df),
+        )
+
+    def _read_preview(self, raw: bytes) -> _ParsedCsv:
+        """Keep the first ``PREVIEW_ROWS`` rows; only count and type the rest."""
+        preview: Optional[pd.DataFrame] = None
+        row_count = 0
+        kinds: dict[Any, set[str]] = {}
+        with pd.read_csv(io.BytesIO(raw), chunksize=PREVIEW_ROWS) as reader:
+            for chunk in reader:
+                if preview is None:
+                    preview = chunk
+                row_count += len(chunk)
+                for column, dtype in chunk.dtypes.items():
+                    kinds.setdefault(column, set()).add(getattr(dtype, "kind", ""))
+        if preview is None:
+            # pandas yields at least one chunk for any file with a header.
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+
+        logger.info(
+            "Scanned CSV with %d rows, %d columns", row_count, len(preview.columns)
+        )
+        return _ParsedCsv(
+            df=None,
+            records=cast("list[dict[str, Any]]", preview.to_dict("records")),
+            columns=preview.columns.tolist(),
+            column_types={
+                column: _column_type(kinds[column]) for column in preview.columns
+            },
+            row_count=row_count,
+        )
+
     def _infer_column_types(self, df: pd.DataFrame) -> dict[str, str]:
         """Map dataframe dtypes into Vega-Lite encoding types."""
-        types = {}
-        for column in df.columns:
-            dtype = df[column].dtype
-            if pd.api.types.is_datetime64_any_dtype(dtype):
-                types[column] = "temporal"
-            elif pd.api.types.is_numeric_dtype(dtype):
-                types[column] = "quantitative"
-            else:
-                types[column] = "nominal"
-        return types
+        return {
+            str(column): _column_type({getattr(dtype, "kind", "")})
+            for column, dtype in df.dtypes.items()
+        }
@@ -0,0 +1,72 @@
+"""
+Unit tests for the Anthropic LLM service payload construction.
+
+These tests build request payloads without making actual API calls.
+"""
+
+import sys
+from unittest.mock import Mock, patch
+
+from vanna.core.llm import LlmMessage, LlmRequest
+from vanna.core.tool import ToolSchema
+from vanna.core.user import User
+
+
+def _service(**kwargs):
+    with patch.dict(sys.modules, {"anthropic": Mock()}):
+        from vanna.integrations.anthropic import AnthropicLlmService
+
+        return AnthropicLlmService(model="claude-test", api_key="test-key", **kwargs)
+
+
+def _request(**kwargs):
+    return LlmRequest(
+        messages=[LlmMessage(role="user", content="How many artists?")],
+        user=User(id="u1"),
+        **kwargs,
+    )
+
+
+def test_system_prompt_is_marked_for_prompt_caching():
+    service = _service(prompt_caching=True)
+    payload = service._build_payload(_request(system_prompt="You are helpful."))
+
+    assert payload["system"] == [
+        {
+            "type": "text",
+            "text": "You are helpful.",
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+
+
+def test_prompt_caching_is_off_by_default():
+    tools = [
+        ToolSchema(name="run_sql", description="run_sql", parameters={"type": "object"})
+    ]
+    payload = _service()._build_payload(
+        _request(system_prompt="You are helpful.", tools=tools)
+    )
+
+    assert payload["system"] == "You are helpful."
+    assert "cache_control" not in payload["tools"][0]
+
+
+def test_payload_without_system_prompt_has_no_system_block():
+    payload = _service()._build_payload(_request())
+
+    assert "system" not in payload
+
+
+def test_last_tool_definition_is_a_separate_cache_breakpoint():
+    tools = [
+        ToolSchema(name=name, description=name, parameters={"type": "object"})
+        for name in ("run_sql", "visualize_data")
+    ]
+    payload = _service(prompt_caching=True)._build_payload(_request(tools=tools))
+
+    assert "cache_control" not in payload["tools"][0]
+    assert payload["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+
+    uncached = _service(prompt_caching=False)._build_payload(_request(tools=tools))
+    assert all("cache_control" not in tool for tool in uncached["tools"])
@@ -48,3 +48,14 @@ def test_chart_spec_rejects_executable_tokens():
             },
             dataset=[],
         )
+
+
+@pytest.mark.parametrize("payload", ["<SCRIPT>alert(1)</script>", "new function(x)"])
+def test_chart_spec_rejects_executable_tokens_in_any_case(payload):
+    with pytest.raises(ValueError, match="blocked executable token"):
+        ChartSpec(
+            format="plotly-json",
+            schema_version="v2",
+            spec={"data": []},
+            dataset=[{"label": payload}],
+        )
@@ -0,0 +1,46 @@
+"""Tests for component lifecycle tracking in ComponentManager."""
+
+from vanna.components.rich import ComponentType, RichComponent
+from vanna.core.component_manager import ComponentManager
+
+
+def _component(index: int) -> RichComponent:
+    return RichComponent(id=f"c{index}", type=ComponentType.TEXT)
+
+
+def test_update_history_is_unbounded_by_default():
+    manager = ComponentManager()
+    for i in range(5):
+        manager.emit(_component(i))
+
+    updates = manager.get_updates_since()
+    assert isinstance(updates, list)
+    assert [u.target_id for u in updates] == ["c0", "c1", "c2", "c3", "c4"]
+
+
+def test_update_history_keeps_most_recent_updates_when_bounded():
+    manager = ComponentManager(max_history=2)
+    for i in range(5):
+        manager.emit(_component(i))
+
+    assert [u.target_id for u in manager.get_updates_since()] == ["c3", "c4"]
+    assert set(manager.components) == {"c0", "c1", "c2", "c3", "c4"}
+
+
+def test_remove_detaches_nested_component_and_its_children():
+    from vanna.core.component_manager import Position
+
+    manager = ComponentManager()
+    manager.emit(_component(0))
+    manager.component_tree.add_component(
+        _component(1), Position(anchor_id="c0", relation="inside")
+    )
+    manager.component_tree.add_component(
+        _component(2), Position(anchor_id="c1", relation="inside")
+    )
+
+    manager.component_tree.remove_component("c1")
+
+    tree = manager.component_tree
+    assert tree.root.children == []
+    assert set(tree.flat_index) == {"c0"}
@@ -0,0 +1,57 @@
+"""Tests for the FastAPI chat routes."""
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from starlette.requests import Request  # noqa: E402
+
+from vanna.servers.fastapi.routes import _request_context  # noqa: E402
+
+
+def test_request_context_keeps_first_value_of_repeated_header():
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "query_string": b"",
+            "headers": [(b"x-forwarded-for", b"first"), (b"x-forwarded-for", b"last")],
+        }
+    )
+
+    context = _request_context(request, {})
+
+    assert context.headers["x-forwarded-for"] == "first"
+
+
+def test_index_route_answers_matching_if_none_match_with_304():
+    pytest.importorskip("httpx")  # required by TestClient
+
+    from types import SimpleNamespace
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from vanna.servers.fastapi.routes import register_chat_routes
+
+    app = FastAPI()
+    register_chat_routes(app, SimpleNamespace(agent=None))
+    client = TestClient(app)
+
+    first = client.get("/")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert etag
+
+    cached = client.get("/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+    stale = client.get("/", headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.content == first.content
+
+    for header in (f'"stale", {etag}', f"W/{etag}", "*"):
+        assert client.get("/", headers={"If-None-Match": header}).status_code == 304
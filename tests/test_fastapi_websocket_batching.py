@@ -0,0 +1,61 @@
+"""Tests for batched WebSocket chunk delivery in the FastAPI routes."""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from vanna.servers.base.models import ChatStreamChunk  # noqa: E402
+from vanna.servers.fastapi.routes import _send_chunks_batched  # noqa: E402
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.frames = []
+
+    async def send_text(self, data):
+        self.frames.append(json.loads(data))
+
+
+def _chunk(i):
+    return ChatStreamChunk(
+        rich={"type": "text", "content": str(i)},
+        conversation_id="conv_1",
+        request_id="req_1",
+    )
+
+
+async def test_send_chunks_batched_respects_max_batch_size():
+    async def chunks():
+        for i in range(5):
+            yield _chunk(i)
+
+    ws = _FakeWebSocket()
+    last = await _send_chunks_batched(ws, chunks(), max_wait_s=10, max_batch_size=2)
+
+    assert [len(frame["batch"]) for frame in ws.frames] == [2, 2, 1]
+    assert last is not None and last.rich["content"] == "4"
+
+
+async def test_send_chunks_batched_flushes_after_wait_without_cancelling_stream():
+    async def chunks():
+        yield _chunk(0)
+        await asyncio.sleep(0.05)
+        yield _chunk(1)
+
+    ws = _FakeWebSocket()
+    await _send_chunks_batched(ws, chunks(), max_wait_s=0.001, max_batch_size=16)
+
+    assert [frame["batch"][0]["rich"]["content"] for frame in ws.frames] == ["0", "1"]
+
+
+async def test_send_chunks_batched_empty_stream_sends_nothing():
+    async def chunks():
+        return
+        yield  # pragma: no cover
+
+    ws = _FakeWebSocket()
+    assert await _send_chunks_batched(ws, chunks(), 0.01, 16) is None
+    assert ws.frames == []
@@ -38,3 +38,33 @@ async def test_feedback_service_patches_negative_and_corrective_memory(tmp_path)
     assert result.review_queued is True
     memories = await memory.get_recent_memories(context, limit=10)
     assert len(memories) >= 2
+
+
+@pytest.mark.asyncio
+async def test_feedback_service_appends_jsonl_across_calls(tmp_path):
+    import json
+
+    context = ToolContext(
+        user=User(id="u1", group_memberships=["user"]),
+        conversation_id="c1",
+        request_id="r1",
+        agent_memory=DemoAgentMemory(),
+    )
+    log_path = tmp_path / "nested" / "feedback.jsonl"
+    service = FeedbackService(
+        feedback_log_path=str(log_path),
+        review_queue_path=str(tmp_path / "review.jsonl"),
+    )
+
+    for question in ["Umsatz pro Monat für Köln?", "Revenue by month?"]:
+        await service.process_feedback(
+            FeedbackRequest(rating="up", question=question), context
+        )
+
+    raw = log_path.read_bytes()
+    assert raw.isascii()  # non-ASCII text is escaped, as it always has been
+    lines = raw.decode("ascii").splitlines()
+    assert [json.loads(line)["question"] for line in lines] == [
+        "Umsatz pro Monat für Köln?",
+        "Revenue by month?",
+    ]
@@ -77,3 +77,43 @@ async def test_execute_unknown_metric_is_empty(model_file, db):
 
     result = await adapter.execute(SemanticQueryRequest(metric="nope"), context=None)
     assert result.row_count == 0
+
+
+@pytest.mark.asyncio
+async def test_plan_matches_synonyms_literally(tmp_path, db):
+    model = tmp_path / "literal.yaml"
+    model.write_text(
+        'metrics:\n  - name: arr\n    synonyms: ["a.r.r (usd)"]\n    sql: "SELECT 1"\n'
+    )
+    adapter = _adapter(str(model), db)
+
+    hit = await adapter.plan("What is our A.R.R (USD) this year?", context=None)
+    miss = await adapter.plan("What is aXrXr (USD)?", context=None)
+
+    assert hit.request is not None and hit.request.metric == "arr"
+    assert miss.coverage == "missing"
+
+
+@pytest.mark.asyncio
+async def test_plan_prefers_first_declared_metric(model_file, db):
+    adapter = _adapter(model_file, db)
+
+    hint = await adapter.plan("order count and sales by day", context=None)
+
+    assert hint.request is not None and hint.request.metric == "revenue"
+
+
+@pytest.mark.asyncio
+async def test_plan_reuses_match_for_repeated_question(model_file, db):
+    from vanna.integrations.semantic.file_adapter import _first_match
+
+    adapter = _adapter(model_file, db)
+    _first_match.cache_clear()
+
+    first = await adapter.plan("Total SALES by month", context=None)
+    second = await adapter.plan("total sales by month", context=None)
+
+    assert first.request is not None and second.request is not None
+    assert first.request.metric == second.request.metric == "revenue"
+    assert first is not second
+    assert _first_match.cache_info().hits == 1
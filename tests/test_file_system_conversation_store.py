@@ -0,0 +1,58 @@
+"""Tests for listing conversations from the file system conversation store."""
+
+from vanna.core.user import User
+from vanna.integrations.local.file_system_conversation_store import (
+    FileSystemConversationStore,
+)
+
+
+async def test_list_conversations_pages_by_most_recent_update(tmp_path):
+    store = FileSystemConversationStore(base_dir=str(tmp_path))
+    alice = User(id="alice")
+    for conversation_id in ("c1", "c2", "c3"):
+        await store.create_conversation(conversation_id, alice, f"hi {conversation_id}")
+    await store.create_conversation("other", User(id="bob"), "hello")
+
+    c1 = await store.get_conversation("c1", alice)
+    await store.update_conversation(c1)
+
+    first_page = await store.list_conversations(alice, limit=2)
+    second_page = await store.list_conversations(alice, limit=2, offset=2)
+
+    assert [c.id for c in first_page] == ["c1", "c3"]
+    assert [c.id for c in second_page] == ["c2"]
+    assert [m.content for m in first_page[0].messages] == ["hi c1"]
+
+
+async def test_update_conversation_appends_only_new_messages(tmp_path):
+    from vanna.core.storage import Message
+
+    store = FileSystemConversationStore(base_dir=str(tmp_path))
+    alice = User(id="alice")
+    conversation = await store.create_conversation("c1", alice, "first")
+
+    conversation.add_message(Message(role="assistant", content="second"))
+    await store.update_conversation(conversation)
+    conversation.add_message(Message(role="user", content="third"))
+    await store.update_conversation(conversation)
+
+    loaded = await store.get_conversation("c1", alice)
+    assert [m.content for m in loaded.messages] == ["first", "second", "third"]
+
+
+async def test_list_conversations_skips_broken_entries_before_paging(tmp_path):
+    import json
+
+    store = FileSystemConversationStore(base_dir=str(tmp_path))
+    alice = User(id="alice")
+    for conversation_id in ("c1", "c2", "c3"):
+        await store.create_conversation(conversation_id, alice, f"hi {conversation_id}")
+
+    metadata_path = tmp_path / "c3" / "metadata.json"
+    metadata = json.loads(metadata_path.read_text())
+    metadata["created_at"] = "not a timestamp"
+    metadata_path.write_text(json.dumps(metadata))
+
+    page = await store.list_conversations(alice, limit=2)
+
+    assert sorted(c.id for c in page) == ["c1", "c2"]
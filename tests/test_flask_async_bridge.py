@@ -2,7 +2,11 @@ import pytest
 
 pytest.importorskip("flask")
 
-from vanna.servers.flask._async import run_async, iter_async  # noqa: E402
+from vanna.servers.flask._async import (  # noqa: E402
+    iter_async,
+    iter_async_coalesced,
+    run_async,
+)
 
 
 def test_run_async_executes_coroutine():
@@ -34,3 +38,88 @@ def test_iter_async_closes_generator_on_early_exit():
     assert next(it) == 0
     it.close()  # consumer stops early (e.g. SSE client disconnect)
     assert closed == [True]
+
+
+def test_iter_async_closes_suspended_generator_on_early_exit():
+    import asyncio
+
+    closed = []
+
+    async def agen():
+        try:
+            yield 0
+            await asyncio.sleep(10)
+            yield 1  # pragma: no cover
+        finally:
+            closed.append(True)
+
+    it = iter_async(agen())
+    assert next(it) == 0
+    it.close()
+    assert closed == [True]
+
+
+def test_iter_async_propagates_errors():
+    async def agen():
+        yield 1
+        raise ValueError("boom")
+
+    it = iter_async(agen())
+    assert next(it) == 1
+    with pytest.raises(ValueError, match="boom"):
+        next(it)
+
+
+def test_iter_async_coalesced_merges_fast_items_and_flushes_when_idle():
+    import asyncio
+
+    async def agen():
+        yield b"a"
+        yield b"b"
+        await asyncio.sleep(0.1)
+        yield b"c"
+
+    frames = list(iter_async_coalesced(agen(), max_bytes=1024, flush_after_s=0.05))
+    assert frames == [b"ab", b"c"]
+
+
+def test_iter_async_coalesced_flushes_at_max_bytes():
+    async def agen():
+        for _ in range(5):
+            yield b"xx"
+
+    frames = list(iter_async_coalesced(agen(), max_bytes=4, flush_after_s=10))
+    assert frames == [b"xxxx", b"xxxx", b"xx"]
+
+
+def test_iter_async_raises_when_generator_is_cancelled():
+    import asyncio
+
+    async def agen():
+        yield 1
+        raise asyncio.CancelledError()
+
+    it = iter_async(agen())
+    assert next(it) == 1
+    with pytest.raises(asyncio.CancelledError):
+        next(it)  # must not block waiting for an end marker
+
+
+def test_pump_stays_bounded_ahead_of_a_slow_consumer():
+    import time
+
+    from vanna.servers.flask._async import _ITEM, _pumped
+
+    produced = []
+
+    async def agen():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    with _pumped(agen(), max_pending=2) as take:
+        time.sleep(0.1)
+        assert len(produced) <= 3
+        assert take(None) == (_ITEM, 0)
+        time.sleep(0.1)
+        assert len(produced) <= 4
@@ -0,0 +1,34 @@
+"""Tests for the Flask chat routes."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("flask")
+
+from flask import Flask  # noqa: E402
+
+from vanna.servers.flask.routes import register_chat_routes  # noqa: E402
+
+
+def test_index_route_answers_matching_if_none_match_with_304():
+    app = Flask(__name__)
+    register_chat_routes(app, SimpleNamespace(agent=None))
+    client = app.test_client()
+
+    first = client.get("/")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert etag
+
+    cached = client.get("/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.data == b""
+
+    stale = client.get("/", headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.data == first.data
+
+    for header in (f'"stale", {etag}', f"W/{etag}", "*"):
+        assert client.get("/", headers={"If-None-Match": header}).status_code == 304
@@ -0,0 +1,14 @@
+"""Tests for lazily imported package exports."""
+
+import subprocess
+import sys
+
+
+def test_import_vanna_does_not_load_plotly():
+    code = (
+        "import sys, vanna; "
+        "assert 'vanna.integrations.plotly' not in sys.modules; "
+        "from vanna.integrations import PlotlyChartGenerator; "
+        "assert PlotlyChartGenerator.__module__.startswith('vanna.integrations.plotly')"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,19 @@
+"""Tests for listing conversations from the in-memory conversation store."""
+
+from vanna.core.user import User
+from vanna.integrations.local.storage import MemoryConversationStore
+
+
+async def test_list_conversations_only_returns_the_users_own():
+    store = MemoryConversationStore()
+    alice, bob = User(id="alice"), User(id="bob")
+    for conversation_id in ("c1", "c2"):
+        await store.create_conversation(conversation_id, alice, "hi")
+    await store.create_conversation("b1", bob, "hello")
+
+    assert await store.delete_conversation("c1", alice) is True
+    assert await store.delete_conversation("b1", alice) is False
+
+    assert [c.id for c in await store.list_conversations(alice)] == ["c2"]
+    assert [c.id for c in await store.list_conversations(bob)] == ["b1"]
+    assert await store.list_conversations(User(id="carol")) == []
@@ -74,3 +74,370 @@ async def test_schema_sync_detects_drift_and_patches_memory(tmp_path):
 
     recent_text = await memory.get_recent_text_memories(context, limit=5)
     assert any("Schema drift detected" in m.content for m in recent_text)
+
+
+@pytest.mark.asyncio
+async def test_latest_snapshot_summary_matches_snapshot(tmp_path):
+    service = PortableSchemaCatalogService(
+        EvolvingSqlRunner(), persist_path=str(tmp_path / "schema.json")
+    )
+    assert await service.get_latest_snapshot_summary() is None
+
+    context = ToolContext(
+        user=User(id="u1", group_memberships=["admin"]),
+        conversation_id="c1",
+        request_id="r1",
+        agent_memory=DemoAgentMemory(),
+    )
+    result = await service.sync(context)
+
+    summary = await service.get_latest_snapshot_summary()
+    assert summary is not None
+    assert summary.schema_hash == result.snapshot.schema_hash
+    assert summary.snapshot_id == result.snapshot.snapshot_id
+    assert not hasattr(summary, "columns")
+
+
+def test_compute_hash_is_order_independent_for_each_algo():
+    from vanna.capabilities.schema_catalog import SchemaColumn
+
+    columns = [
+        SchemaColumn(table_name="orders", column_name="id", data_type="integer"),
+        SchemaColumn(
+            table_name="orders",
+            column_name="status",
+            data_type="text",
+            is_nullable=True,
+        ),
+    ]
+    algos = ["sha256"]
+    try:
+        import xxhash  # noqa: F401
+
+        algos.append("xxh3")
+    except ImportError:
+        pass
+
+    hashes = set()
+    for algo in algos:
+        service = PortableSchemaCatalogService(EvolvingSqlRunner(), hash_algo=algo)
+        forward = service._compute_hash(columns)
+        assert forward == service._compute_hash(list(reversed(columns)))
+        assert forward != service._compute_hash(columns[:1])
+        hashes.add(forward)
+    assert len(hashes) == len(algos)
+
+
+def test_sha256_hash_matches_canonical_json_form():
+    import hashlib
+    import json
+
+    from vanna.capabilities.schema_catalog import SchemaColumn
+
+    columns = [
+        SchemaColumn(table_name="orders", column_name="note", data_type="text"),
+        SchemaColumn(
+            schema_name="public",
+            table_name="caf\u00e9",
+            column_name="id",
+            data_type="integer",
+            is_nullable=False,
+        ),
+    ]
+    canonical = sorted(
+        (
+            {
+                "schema_name": c.schema_name or "",
+                "table_name": c.table_name,
+                "column_name": c.column_name,
+                "data_type": c.data_type,
+                "is_nullable": c.is_nullable,
+            }
+            for c in columns
+        ),
+        key=lambda c: (
+            c["schema_name"],
+            c["table_name"],
+            c["column_name"],
+            c["data_type"],
+        ),
+    )
+    expected = hashlib.sha256(
+        json.dumps(canonical, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+
+    service = PortableSchemaCatalogService(EvolvingSqlRunner())
+    assert service._compute_hash(columns) == expected
+    assert service._compute_hash([]) == hashlib.sha256(b"[]").hexdigest()
+
+
+def test_unknown_hash_algo_is_rejected():
+    with pytest.raises(ValueError):
+        PortableSchemaCatalogService(EvolvingSqlRunner(), hash_algo="md5")
+
+
+class SqliteCatalogRunner(SqlRunner):
+    """Mimics SQLite: no information_schema, columns via PRAGMA table_info."""
+
+    tables = {
+        "customers": [("id", "INTEGER", 1), ("name", "TEXT", 0)],
+        "orders": [("id", "INTEGER", 1), ("total", "REAL", 0)],
+    }
+
+    async def run_sql(self, args: RunSqlToolArgs, context: ToolContext) -> pd.DataFrame:
+        if "information_schema" in args.sql:
+            raise RuntimeError("no such table: information_schema.columns")
+        if "sqlite_master" in args.sql:
+            return pd.DataFrame({"name": sorted(self.tables)})
+        for table, rows in self.tables.items():
+            if f'PRAGMA table_info("{table}")' in args.sql:
+                return pd.DataFrame(rows, columns=["name", "type", "notnull"])
+        raise ValueError("Unexpected SQL")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_fallback_reads_columns_from_pragma(tmp_path):
+    service = PortableSchemaCatalogService(
+        SqliteCatalogRunner(), persist_path=str(tmp_path / "schema.json")
+    )
+    context = ToolContext(
+        user=User(id="u1", group_memberships=["admin"]),
+        conversation_id="c1",
+        request_id="r1",
+        agent_memory=DemoAgentMemory(),
+    )
+
+    snapshot = await service.capture_snapshot(context)
+
+    assert [
+        (c.schema_name, c.table_name, c.column_name, c.data_type, c.is_nullable)
+        for c in snapshot.columns
+    ] == [
+        ("main", "customers", "id", "INTEGER", False),
+        ("main", "customers", "name", "TEXT", True),
+        ("main", "orders", "id", "INTEGER", False),
+        ("main", "orders", "total", "REAL", True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_persisted_snapshot_is_replaced_without_leftovers(tmp_path):
+    runner = EvolvingSqlRunner()
+    service = PortableSchemaCatalogService(
+        runner, persist_path=str(tmp_path / "schema.json")
+    )
+    context = ToolContext(
+        user=User(id="u1", group_memberships=["admin"]),
+        conversation_id="c1",
+        request_id="r1",
+        agent_memory=DemoAgentMemory(),
+    )
+
+    await service.sync(context)
+    runner.version = 1
+    second = await service.sync(context)
+
+    assert [p.name for p in tmp_path.iterdir()] == ["schema.json"]
+    latest = await service.get_latest_snapshot()
+    assert latest is not None
+    assert latest.schema_hash == second.snapshot.schema_hash
+
+
+@pytest.mark.asyncio
+async def test_persisted_snapshot_gets_umask_mode_then_keeps_existing_mode(tmp_path):
+    import os
+    import stat
+
+    runner = EvolvingSqlRunner()
+    persist_path = tmp_path / "schema.json"
+    service = PortableSchemaCatalogService(runner, persist_path=str(persist_path))
+    context = ToolContext(
+        user=User(id="u1", group_memberships=["admin"]),
+        conversation_id="c1",
+        request_id="r1",
+        agent_memory=DemoAgentMemory(),
+    )
+
+    previous_umask = os.umask(0o022)
+    try:
+        await service.sync(context)
+        assert stat.S_IMODE(persist_path.stat().st_mode) == 0o644
+
+        persist_path.chmod(0o640)
+        runner.version = 1
+        await service.sync(context)
+        assert stat.S_IMODE(persist_path.stat().st_mode) == 0o640
+    finally:
+        os.umask(previous_umask)
+
+
+@pytest.mark.asyncio
+async def test_latest_snapshot_is_reused_until_file_changes(tmp_path):
+    persist_path = tmp_path / "schema.json"
+    service = PortableSchemaCatalogService(
+        EvolvingSqlRunner(), persist_path=str(persist_path)
+    )
+    context = ToolContext(
+        user=User(id="u1", group_memberships=["admin"]),
+        conversation_id="c1",
+        request_id="r1",
+        agent_memory=DemoAgentMemory(),
+    )
+    result = await service.sync(context)
+
+    first = await service.get_latest_snapshot()
+    assert first is result.snapshot
+    assert await service.get_latest_snapshot() is first
+
+    # Another writer replacing the file is picked up.
+    other = PortableSchemaCatalogService(
+        EvolvingSqlRunner(), persist_path=str(persist_path)
+    )
+    replacement = first.model_copy(update={"snapshot_id": "snap_other"})
+    other._persist_snapshot(replacement)
+    reloaded = await service.get_latest_snapshot()
+    assert reloaded is not None
+    assert reloaded.snapshot_id == "snap_other"
+    summary = await service.get_latest_snapshot_summary()
+    assert summary is not None
+    assert summary.snapshot_id == "snap_other"
+
+
+@pytest.mark.asyncio
+async def test_sync_without_changes_keeps_persisted_snapshot(tmp_path):
+    persist_path = tmp_path / "schema.json"
+    service = PortableSchemaCatalogService(
+        EvolvingSqlRunner(), persist_path=str(persist_path)
+    )
+    memory = DemoAgentMemory()
+    context = ToolContext(
+        user=User(id="u1", group_memberships=["admin"]),
+        conversation_id="c1",
+        request_id="r1",
+        agent_memory=memory,
+    )
+    first = await service.sync(context)
+    written = persist_path.stat().st_mtime_ns
+    memories_after_first = len(
+        await memory.get_recent_text_memories(context, limit=100)
+    )
+
+    second = await service.sync(context)
+
+    assert second.diff.has_drift is False
+    assert second.diff.previous_schema_hash == first.snapshot.schema_hash
+    assert second.snapshot.snapshot_id == first.snapshot.snapshot_id
+    assert persist_path.stat().st_mtime_ns == written
+    assert (
+        len(await memory.get_recent_text_memories(context, limit=100))
+        == memories_after_first
+    )
+
+
+def test_invalid_cron_schedule_is_rejected_at_construction():
+    with pytest.raises(ValueError):
+        PortableSchemaCatalogService(EvolvingSqlRunner(), cron_schedule="*/5 * *")
+
+
+@pytest.mark.asyncio
+async def test_scheduled_sync_runs_once_per_matching_minute(tmp_path):
+    from datetime import datetime
+
+    service = PortableSchemaCatalogService(
+        EvolvingSqlRunner(),
+        persist_path=str(tmp_path / "schema.json"),
+        cron_schedule="*/15 9 * * *",
+    )
+    context = ToolContext(
+        user=User(id="u1", group_memberships=["admin"]),
+        conversation_id="c1",
+        request_id="r1",
+        agent_memory=DemoAgentMemory(),
+    )
+
+    due = datetime(2024, 3, 4, 9, 30, 5)
+    assert await service.run_scheduled_sync_if_due(context, now=due) is not None
+    assert (
+        await service.run_scheduled_sync_if_due(context, now=due.replace(second=40))
+        is None
+    )
+    assert (
+        await service.run_scheduled_sync_if_due(
+            context, now=datetime(2024, 3, 4, 9, 31)
+        )
+        is None
+    )
+    assert (
+        await service.run_scheduled_sync_if_due(
+            context, now=datetime(2024, 3, 4, 9, 45)
+        )
+        is not None
+    )
+
+
+@pytest.mark.asyncio
+async def test_background_schedule_syncs_at_minute_boundary(tmp_path, monkeypatch):
+    import asyncio
+
+    from vanna.services import schema_sync
+
+    # Pretend every tick lands just short of a minute boundary.
+    monkeypatch.setattr(schema_sync, "_seconds_until_next_minute", lambda: 0.01)
+    service = PortableSchemaCatalogService(
+        EvolvingSqlRunner(),
+        persist_path=str(tmp_path / "schema.json"),
+        cron_schedule="* * * * *",
+    )
+    contexts = []
+
+    def make_context():
+        context = ToolContext(
+            user=User(id="u1", group_memberships=["admin"]),
+            conversation_id="c1",
+            request_id="r1",
+            agent_memory=DemoAgentMemory(),
+        )
+        contexts.append(context)
+        return context
+
+    service.start_background(make_context)
+    for _ in range(50):
+        await asyncio.sleep(0.01)
+        if await service.get_latest_snapshot() is not None:
+            break
+    await service.stop_background()
+
+    assert contexts
+    assert await service.get_latest_snapshot() is not None
+    assert service._background_task is None
+
+
+def test_diff_snapshots_classifies_added_removed_and_changed():
+    from vanna.capabilities.schema_catalog import SchemaColumn, SchemaSnapshot
+
+    def col(name, data_type="text", nullable=True):
+        return SchemaColumn(
+            table_name="orders",
+            column_name=name,
+            data_type=data_type,
+            is_nullable=nullable,
+        )
+
+    previous = SchemaSnapshot(
+        snapshot_id="p",
+        schema_hash="hp",
+        columns=[col("id", "integer", False), col("note"), col("status")],
+    )
+    current = SchemaSnapshot(
+        snapshot_id="c",
+        schema_hash="hc",
+        columns=[col("id", "bigint", False), col("status"), col("total", "numeric")],
+    )
+    service = PortableSchemaCatalogService(EvolvingSqlRunner())
+
+    diff = service._diff_snapshots(previous, current)
+
+    assert [c.column_name for c in diff.added_columns] == ["total"]
+    assert [c.column_name for c in diff.removed_columns] == ["note"]
+    assert [c.column_name for c in diff.changed_columns] == ["id"]
+    assert service._diff_snapshots(current, current).has_drift is False
@@ -0,0 +1,84 @@
+"""Tests for the stale-while-revalidate schema metadata cache."""
+
+import asyncio
+from datetime import datetime
+
+from vanna.capabilities.schema_catalog import SchemaSnapshotSummary
+from vanna.servers.base.schema_metadata import SchemaMetadataCache
+
+
+class CountingCatalog:
+    def __init__(self):
+        self.calls = 0
+        self.schema_hash = "h1"
+
+    async def get_latest_snapshot_summary(self):
+        self.calls += 1
+        return SchemaSnapshotSummary(
+            snapshot_id=f"snap_{self.calls}",
+            captured_at=datetime(2024, 1, 1),
+            schema_hash=self.schema_hash,
+        )
+
+
+async def test_cache_serves_cached_value_within_ttl():
+    catalog = CountingCatalog()
+    cache = SchemaMetadataCache(catalog, ttl_s=60)
+
+    first = await cache.get()
+    second = await cache.get()
+
+    assert first == {"schema_hash": "h1", "schema_snapshot_id": "snap_1"}
+    assert second is first
+    assert catalog.calls == 1
+    assert cache.fresh_value() is first
+
+
+async def test_cache_returns_stale_value_and_refreshes_in_background():
+    catalog = CountingCatalog()
+    cache = SchemaMetadataCache(catalog, ttl_s=0)
+
+    await cache.get()
+    catalog.schema_hash = "h2"
+    stale = await cache.get()
+    assert stale["schema_hash"] == "h1"
+
+    await asyncio.sleep(0)
+    assert (await cache.get())["schema_hash"] == "h2"
+
+
+async def test_cache_invalidate_forces_reload():
+    catalog = CountingCatalog()
+    cache = SchemaMetadataCache(catalog, ttl_s=60)
+
+    await cache.get()
+    catalog.schema_hash = "h2"
+    cache.invalidate()
+
+    assert cache.fresh_value() is None
+    assert (await cache.get())["schema_hash"] == "h2"
+
+
+async def test_cache_without_service_returns_empty_metadata():
+    assert await SchemaMetadataCache(None).get() == {}
+
+
+async def test_failed_background_refresh_is_logged_and_keeps_stale_value(caplog):
+    class FlakyCatalog(CountingCatalog):
+        async def get_latest_snapshot_summary(self):
+            if self.calls:
+                self.calls += 1
+                raise RuntimeError("catalog unavailable")
+            return await super().get_latest_snapshot_summary()
+
+    catalog = FlakyCatalog()
+    cache = SchemaMetadataCache(catalog, ttl_s=0)
+    first = await cache.get()
+
+    with caplog.at_level("ERROR", logger="vanna.servers.base.schema_metadata"):
+        assert await cache.get() is first
+        await asyncio.sleep(0)
+
+    assert cache._refresh is not None and cache._refresh.exception() is None
+    assert "Failed to refresh schema metadata" in caplog.text
+    assert await cache.get() is first
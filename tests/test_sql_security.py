@@ -51,8 +51,13 @@ async def test_run_sql_blocks_multi_statement_by_default(tool_context):
 
 
 @pytest.mark.asyncio
-async def test_run_sql_allows_select_in_read_only_mode(tool_context):
-    tool = RunSqlTool(sql_runner=DummySqlRunner())
+async def test_run_sql_allows_select_in_read_only_mode(tool_context, tmp_path):
+    from vanna.integrations.local import LocalFileSystem
+
+    tool = RunSqlTool(
+        sql_runner=DummySqlRunner(),
+        file_system=LocalFileSystem(working_directory=str(tmp_path)),
+    )
     result = await tool.execute(tool_context, RunSqlToolArgs(sql="SELECT 1"))
     assert result.success is True
 
@@ -95,6 +100,47 @@ def test_blocks_update_statement():
     assert err is not None
 
 
+def test_disallowed_keyword_is_rejected_before_parsing(monkeypatch):
+    from vanna.tools import run_sql
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("sqlglot.parse should not be called")
+
+    monkeypatch.setattr(run_sql.sqlglot, "parse", _fail)
+    err = _tool()._validate_read_only_sql("DROP TABLE users")
+    assert err is not None and "Allowed statement types" in err
+
+
+_ALLOWLIST_ERROR = (
+    "Blocked by read-only SQL policy. "
+    "Allowed statement types: DESC, DESCRIBE, EXPLAIN, PRAGMA, SELECT, SHOW, WITH."
+)
+_WRITE_ERROR = (
+    "Blocked by read-only SQL policy: a data-modifying statement was detected."
+)
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        # A disallowed leading keyword is reported before any parsing, so
+        # plain writes, multi-statement batches that start with one and
+        # unparseable text all get the allowlist message.
+        ("DELETE FROM users", _ALLOWLIST_ERROR),
+        ("UPDATE t SET x = 1", _ALLOWLIST_ERROR),
+        ("DROP TABLE a; DROP TABLE b", _ALLOWLIST_ERROR),
+        ("SELEC 1 FROM", _ALLOWLIST_ERROR),
+        # Statements that start with an allowed keyword are parsed and get
+        # the message for whatever the parse finds.
+        ("SELECT 1; DROP TABLE x", "Multiple SQL statements are blocked by default."),
+        ("SELECT * INTO t2 FROM t", _WRITE_ERROR),
+        ("WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d", _WRITE_ERROR),
+    ],
+)
+def test_rejection_messages(sql, expected):
+    assert _tool()._validate_read_only_sql(sql) == expected
+
+
 def test_blocks_select_into_new_table():
     # SELECT ... INTO is a DDL/write in Postgres/MSSQL; it parses as an
     # exp.Select with an exp.Into child and must be blocked.
@@ -128,14 +174,20 @@ def test_allows_plain_explain_select():
 
 
 @pytest.mark.asyncio
-async def test_cte_select_returns_rows_not_rows_affected():
+async def test_cte_select_returns_rows_not_rows_affected(tmp_path):
     import pandas as pd
 
+    from vanna.integrations.local import LocalFileSystem
+
     class _OneRowRunner:
         async def run_sql(self, args, context):
             return pd.DataFrame([{"x": 1}])
 
-    tool = RunSqlTool(sql_runner=_OneRowRunner(), read_only=True)
+    tool = RunSqlTool(
+        sql_runner=_OneRowRunner(),
+        file_system=LocalFileSystem(working_directory=str(tmp_path)),
+        read_only=True,
+    )
 
     class _Ctx:
         pass
@@ -246,3 +298,104 @@ async def test_real_sqlite_runner_plain_select_still_returns_rows(sqlite_db, tmp
     assert result.metadata["query_type"] == "SELECT"
     assert result.metadata["row_count"] == 3
     assert result.metadata["columns"] == ["x"]
+
+
+@pytest.mark.parametrize("rows", [1, 49, 50, 120, 5000])
+def test_csv_preview_matches_full_csv_prefix(rows):
+    df = pd.DataFrame({"n": range(rows), "label": [f"row-{i}" for i in range(rows)]})
+    full = df.to_csv(index=False)
+
+    preview = RunSqlTool._csv_preview(df, 1000)
+
+    assert full.startswith(preview)
+    assert preview[:1000] == full[:1000]
+
+
+@pytest.mark.asyncio
+async def test_saved_csv_matches_full_dataframe(tmp_path):
+    from vanna.integrations.local import LocalFileSystem
+
+    df = pd.DataFrame({"n": range(25), "label": [f"row-{i}" for i in range(25)]})
+
+    class _FrameRunner:
+        async def run_sql(self, args, context):
+            return df
+
+    fs = LocalFileSystem(working_directory=str(tmp_path))
+    tool = RunSqlTool(sql_runner=_FrameRunner(), file_system=fs)
+    tool._iter_csv_chunks = lambda frame: RunSqlTool._iter_csv_chunks(frame, 10)
+
+    context = _make_tool_context()
+    result = await tool.execute(context, RunSqlToolArgs(sql="SELECT * FROM t"))
+
+    saved = await fs.read_file(result.metadata["output_file"], context)
+    assert saved == df.to_csv(index=False)
+
+
+@pytest.mark.asyncio
+async def test_csv_chunks_are_written_off_the_event_loop_thread(tmp_path):
+    import threading
+
+    from vanna.integrations.local import LocalFileSystem
+
+    df = pd.DataFrame({"n": range(3)})
+    chunk_threads = []
+
+    class _FrameRunner:
+        async def run_sql(self, args, context):
+            return df
+
+    def iter_chunks(frame):
+        for chunk in RunSqlTool._iter_csv_chunks(frame, 1):
+            chunk_threads.append(threading.current_thread())
+            yield chunk
+
+    tool = RunSqlTool(
+        sql_runner=_FrameRunner(),
+        file_system=LocalFileSystem(working_directory=str(tmp_path)),
+    )
+    tool._iter_csv_chunks = iter_chunks
+
+    await tool.execute(_make_tool_context(), RunSqlToolArgs(sql="SELECT * FROM t"))
+
+    assert chunk_threads
+    assert threading.current_thread() not in chunk_threads
+
+
+@pytest.mark.asyncio
+async def test_result_rows_match_the_ui_table(tmp_path):
+    from vanna.integrations.local import LocalFileSystem
+
+    df = pd.DataFrame({"n": [1, 2], "label": ["a", "b"]})
+
+    class _FrameRunner:
+        async def run_sql(self, args, context):
+            return df
+
+    tool = RunSqlTool(
+        sql_runner=_FrameRunner(),
+        file_system=LocalFileSystem(working_directory=str(tmp_path)),
+    )
+    result = await tool.execute(
+        _make_tool_context(), RunSqlToolArgs(sql="SELECT * FROM t")
+    )
+
+    table = result.ui_component.rich_component
+    assert result.metadata["results"] is not table.rows
+    assert result.metadata["results"] == table.rows == df.to_dict("records")
+    assert (table.columns, table.row_count, table.column_count) == (
+        ["n", "label"],
+        2,
+        2,
+    )
+
+
+def test_dataframe_component_columns_match_rows_with_duplicate_names():
+    from vanna.components.rich.data.dataframe import DataFrameComponent
+
+    df = pd.DataFrame([[1, 2, "a"]], columns=["id", "id", "label"])
+
+    component = DataFrameComponent.from_dataframe(df)
+
+    assert component.columns == list(component.rows[0]) == ["id", "label"]
+    assert component.column_count == 2
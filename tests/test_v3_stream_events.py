@@ -1,6 +1,8 @@
 """Tests for v3 typed streaming events."""
 
-from vanna.servers.base.events_v3 import ChatEvent
+import json
+
+from vanna.servers.base.events_v3 import ChatEvent, poll_response_json
 from vanna.servers.base.models import ChatStreamChunk
 
 
@@ -22,3 +24,61 @@ def test_chat_event_done_has_typed_done_event():
     assert event.event_version == "v3"
     assert event.event_type == "done"
     assert event.payload["status"] == "done"
+
+
+def test_json_from_chunk_matches_model_dump_json():
+    chunk = ChatStreamChunk(
+        rich={"type": "dataframe", "data": {"rows": [[1, "a"]]}},
+        simple={"type": "text", "text": "1 row"},
+        conversation_id="conv_3",
+        request_id="req_3",
+    )
+    expected = ChatEvent.from_chunk(chunk).model_dump_json().encode()
+    assert ChatEvent.json_from_chunk(chunk) == expected
+
+
+def test_done_json_matches_done_event():
+    raw = ChatEvent.done_json('conv_"4"', "req_4")
+    parsed = ChatEvent.model_validate_json(raw)
+    expected = ChatEvent.done('conv_"4"', "req_4")
+    assert parsed.model_dump(exclude={"timestamp"}) == expected.model_dump(
+        exclude={"timestamp"}
+    )
+    assert raw == parsed.model_dump_json().encode()
+
+
+def test_poll_response_json_wraps_events():
+    chunk = ChatStreamChunk(
+        rich={"type": "text", "content": "hi"},
+        conversation_id="conv_5",
+        request_id="req_5",
+    )
+    events = [ChatEvent.json_from_chunk(chunk), ChatEvent.done_json("conv_5", "req_5")]
+    body = json.loads(poll_response_json(events))
+    assert body["event_version"] == "v3"
+    assert [e["event_type"] for e in body["events"]] == ["assistant_text", "done"]
+    assert json.loads(poll_response_json([])) == {"event_version": "v3", "events": []}
+
+
+async def test_chat_events_v3_stream_ends_with_error_event_on_failure():
+    from vanna.servers.base import ChatRequest
+    from vanna.servers.base.sse import chat_events_v3_stream
+
+    class FailingHandler:
+        async def handle_stream(self, request):
+            yield ChatStreamChunk(
+                rich={"type": "text"}, conversation_id="conv_6", request_id="req_6"
+            )
+            raise RuntimeError("boom")
+
+    frames = [
+        frame
+        async for frame in chat_events_v3_stream(
+            FailingHandler(), ChatRequest(message="hi")
+        )
+    ]
+    assert frames[0].startswith(b"event: assistant_text\n")
+    assert frames[-1].startswith(b"event: error\n")
+    error = json.loads(frames[-1].split(b"data: ", 1)[1])
+    assert error["payload"] == {"message": "boom"}
+    assert error["conversation_id"] == "conv_6"
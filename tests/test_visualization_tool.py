@@ -65,3 +65,119 @@ async def test_visualize_data_returns_declarative_chart_spec():
     assert rich.data["format"] == "vega-lite"
     assert "spec" in rich.data
     assert "dataset" in rich.data
+    assert result.metadata["chart_spec"]["spec"] == rich.data["spec"]
+    assert "dataset" not in result.metadata["chart_spec"]
+
+
+@pytest.mark.asyncio
+async def test_visualize_data_reads_local_csv_bytes(tmp_path):
+    from vanna.tools.file_system import LocalFileSystem
+
+    context = ToolContext(
+        user=User(id="u1", group_memberships=["user"]),
+        conversation_id="c1",
+        request_id="r1",
+        agent_memory=DemoAgentMemory(),
+    )
+    fs = LocalFileSystem(working_directory=str(tmp_path))
+    await fs.write_file("cities.csv", "city,value\nZürich,1\nMünchen,2\n", context)
+
+    tool = VisualizeDataTool(file_system=fs)
+    result = await tool.execute(context, VisualizeDataArgs(filename="cities.csv"))
+
+    assert result.success is True
+    dataset = result.ui_component.rich_component.data["dataset"]
+    assert [row["city"] for row in dataset] == ["Zürich", "München"]
+
+
+@pytest.mark.asyncio
+async def test_visualize_data_reuses_parse_for_unchanged_csv(monkeypatch):
+    import pandas as pd
+
+    from vanna.tools import visualize_data
+
+    context = ToolContext(
+        user=User(id="u1", group_memberships=["user"]),
+        conversation_id="c1",
+        request_id="r1",
+        agent_memory=DemoAgentMemory(),
+    )
+    parses = []
+    read_csv = pd.read_csv
+
+    def counting_read_csv(*args, **kwargs):
+        parses.append(1)
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(visualize_data.pd, "read_csv", counting_read_csv)
+    tool = VisualizeDataTool(file_system=StubFileSystem())
+
+    first = await tool.execute(context, VisualizeDataArgs(filename="a.csv"))
+    second = await tool.execute(context, VisualizeDataArgs(filename="a.csv"))
+
+    assert first.success and second.success
+    assert len(parses) == 1
+    assert first.metadata["chart_spec"] == second.metadata["chart_spec"]
+
+
+def test_infer_column_types_matches_pandas_dtype_checks():
+    import pandas as pd
+
+    df = pd.DataFrame(
+        {
+            "when": pd.to_datetime(["2025-01-01"]),
+            "when_utc": pd.to_datetime(["2025-01-01"], utc=True),
+            "count": [1],
+            "nullable": pd.array([1], dtype="Int64"),
+            "ratio": [0.5],
+            "flag": [True],
+            "name": ["a"],
+            "kind": pd.Categorical(["x"]),
+            "elapsed": pd.to_timedelta(["1s"]),
+        }
+    )
+
+    types = VisualizeDataTool(file_system=StubFileSystem())._infer_column_types(df)
+
+    assert types == {
+        "when": "temporal",
+        "when_utc": "temporal",
+        "count": "quantitative",
+        "nullable": "quantitative",
+        "ratio": "quantitative",
+        "flag": "quantitative",
+        "name": "nominal",
+        "kind": "nominal",
+        "elapsed": "nominal",
+    }
+
+
+def test_parse_cache_never_holds_full_dataframes():
+    tool = VisualizeDataTool(file_system=StubFileSystem())
+    raw = b"n,label\n1,a\n2,b\n"
+
+    full = tool._parse_csv(raw, full_frame=True)
+    preview = tool._parse_csv(raw, full_frame=False)
+
+    assert full.df is not None
+    assert preview.df is None and preview.records == full.records
+    assert all(parsed.df is None for parsed in tool._parsed_csvs.values())
+    assert tool._parse_csv(raw, full_frame=True).df is not None
+
+
+def test_preview_scan_matches_full_parse_counts_and_types():
+    tool = VisualizeDataTool(file_system=StubFileSystem())
+    lines = ["n,ratio,label,mixed"]
+    lines += [f"{i},{i / 2},row{i},{i}" for i in range(1200)]
+    lines[-1] = "1199,599.5,row1199,not-a-number"
+    raw = ("\n".join(lines) + "\n").encode()
+
+    preview = tool._read_preview(raw)
+    full = tool._read_frame(raw)
+
+    assert preview.df is None
+    assert len(preview.records) == 500
+    assert preview.row_count == full.row_count == 1200
+    assert preview.columns == full.columns
+    assert preview.column_types == full.column_types
+    assert preview.column_types["mixed"] == "nominal"